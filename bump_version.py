@@ -20,29 +20,46 @@ Usage:
 
 import argparse
 import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import StringIO
 from pathlib import Path
+from typing import TextIO
 
 ROOT = Path(__file__).resolve().parent
 
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)")
+_VALID_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(-[\w.]+)?$")
+_CHANGELOG_RE = re.compile(rb"##\s*\[(\d+\.\d+\.\d+)\]")
+_VERSION_FILE_RE = re.compile(r"^\d+\.\d+\.\d+\S*")
+_INIT_RE = re.compile(r'__version__\s*=\s*"[^"]+"')
+_BADGE_RE = re.compile(r'version-[\d.]+-(?:blue|green)\.svg("?\s*alt="Version:\s*[\d.]+")?')
+_ALT_TEXT_RE = re.compile(r'alt="Version:\s*[^"]*"')
+_SETUP_RE = re.compile(r'version\s*=\s*"[^"]+"')
+
 
 def detect_app_name() -> str:
-    for child in ROOT.iterdir():
-        if child.is_dir() and (child / "hooks.py").exists():
-            return child.name
+    with os.scandir(ROOT) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "hooks.py")):
+                return entry.name
     return ROOT.name
 
 
 def read_current_version() -> str:
-    version_file = ROOT / "VERSION"
-    if version_file.exists():
-        return version_file.read_text().strip()
-    return "0.0.0"
+    try:
+        with open(ROOT / "VERSION") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return "0.0.0"
 
 
 def parse_semver(v: str) -> tuple[int, int, int]:
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)", v)
+    match = _SEMVER_RE.match(v)
     if not match:
         raise ValueError(f"Invalid semver: {v}")
     return int(match.group(1)), int(match.group(2)), int(match.group(3))
@@ -61,30 +78,47 @@ def bump_level(current: str, level: str) -> str:
 
 def get_changelog_version() -> str | None:
     changelog = ROOT / "docs" / "CHANGELOG.md"
-    if not changelog.exists():
+    if not changelog.exists() or changelog.stat().st_size == 0:
         return None
-    match = re.search(r"##\s*\[(\d+\.\d+\.\d+)\]", changelog.read_text())
-    return match.group(1) if match else None
+    # The latest entry sits near the top; mmap lets the search stop paging
+    # in the file at the first match instead of reading the whole history.
+    with open(changelog, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        match = _CHANGELOG_RE.search(mm)
+        return match.group(1).decode() if match else None
 
 
 def validate_version(v: str) -> bool:
-    return bool(re.match(r"^\d+\.\d+\.\d+(-[\w.]+)?$", v))
+    return bool(_VALID_VERSION_RE.match(v))
+
 
+def update_file(path: Path, pattern: re.Pattern[str], replacement: str, label: str, dry_run: bool,
+                out: TextIO | None = None, optional: bool = False) -> bool | None:
+    """Replace the first match of pattern in path.
 
-def update_file(path: Path, pattern: str, replacement: str, label: str, dry_run: bool) -> bool:
+    Optional targets that are absent or unmatched return None and are not
+    reported, so callers need no separate presence check beforehand.
+    """
     if not path.exists():
-        print(f"  SKIP  {label} (not found)")
+        if optional:
+            return None
+        print(f"  SKIP  {label} (not found)", file=out)
         return False
     content = path.read_text()
-    new_content, count = re.subn(pattern, replacement, content, count=1)
-    if count == 0:
-        print(f"  SKIP  {label} (pattern not matched)")
+    match = pattern.search(content)
+    if not match:
+        if optional:
+            return None
+        print(f"  SKIP  {label} (pattern not matched)", file=out)
         return False
+    if match.group(0) == replacement:
+        print(f"  OK    {label} (already current)", file=out)
+        return True
+    new_content = content[:match.start()] + replacement + content[match.end():]
     if dry_run:
-        print(f"  OK    {label} (dry-run)")
+        print(f"  OK    {label} (dry-run)", file=out)
         return True
     path.write_text(new_content)
-    print(f"  OK    {label}")
+    print(f"  OK    {label}", file=out)
     return True
 
 
@@ -98,12 +132,12 @@ def read_platform() -> dict[str, str]:
 
 # Patterns that match stale platform references in docs/code.
 # Each entry: (key in platform.json, regex that captures the version part, description)
-PLATFORM_PATTERNS: list[tuple[str, str, str]] = [
-    ("frappe", r"[Ff]rappe[\s_-]*v(\d+)", "Frappe version"),
-    ("frappe", r"frappe-v(\d+)\+", "Frappe badge"),
-    ("python", r"Python\s+(\d+\.\d+)", "Python version"),
-    ("node", r"Node(?:\.?js)?\s+(\d+)", "Node version"),
-    ("mariadb", r"MariaDB\s+(\d+\.\d+)", "MariaDB version"),
+PLATFORM_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
+    ("frappe", re.compile(r"[Ff]rappe[\s_-]*v(\d+)"), "Frappe version"),
+    ("frappe", re.compile(r"frappe-v(\d+)\+"), "Frappe badge"),
+    ("python", re.compile(r"Python\s+(\d+\.\d+)"), "Python version"),
+    ("node", re.compile(r"Node(?:\.?js)?\s+(\d+)"), "Node version"),
+    ("mariadb", re.compile(r"MariaDB\s+(\d+\.\d+)"), "MariaDB version"),
 ]
 
 
@@ -130,7 +164,7 @@ def audit_platform(dry_run: bool = True) -> int:
             expected = platform.get(key)
             if not expected:
                 continue
-            for m in re.finditer(pattern, content):
+            for m in pattern.finditer(content):
                 found = m.group(1)
                 if found != expected:
                     stale_count += 1
@@ -146,18 +180,28 @@ def audit_platform(dry_run: bool = True) -> int:
     return stale_count
 
 
-def update_json(path: Path, key: str, version: str, label: str, dry_run: bool) -> bool:
+def update_json(path: Path, key: str, version: str, label: str, dry_run: bool,
+                out: TextIO | None = None) -> bool:
     if not path.exists():
-        print(f"  SKIP  {label} (not found)")
+        print(f"  SKIP  {label} (not found)", file=out)
         return False
-    data = json.loads(path.read_text())
-    old = data.get(key)
-    data[key] = version
+    content = path.read_text()
+    # Swap the value in place so the file's own formatting is preserved;
+    # fall back to a full parse/dump if the key is not laid out as expected.
+    match = re.search(rf'("{re.escape(key)}"\s*:\s*)"([^"\\]*)"', content)
+    if match:
+        old = match.group(2)
+        new_content = content[:match.start()] + f'{match.group(1)}"{version}"' + content[match.end():]
+    else:
+        data = json.loads(content)
+        old = data.get(key)
+        data[key] = version
+        new_content = json.dumps(data, indent=2) + "\n"
     if dry_run:
-        print(f"  OK    {label}  {old} → {version} (dry-run)")
+        print(f"  OK    {label}  {old} → {version} (dry-run)", file=out)
         return True
-    path.write_text(json.dumps(data, indent=2) + "\n")
-    print(f"  OK    {label}  {old} → {version}")
+    path.write_text(new_content)
+    print(f"  OK    {label}  {old} → {version}", file=out)
     return True
 
 
@@ -207,58 +251,77 @@ def main():
     mode = " (dry-run)" if args.dry_run else ""
     print(f"\n{app_name}: {current} → {new_version}{mode}\n")
 
-    results = []
+    # Each job group owns one file; groups run concurrently, updates to the
+    # same file (README badge + alt text) stay sequential within a group.
+    groups = []
 
     # 1. VERSION
-    results.append(update_file(
+    groups.append([partial(
+        update_file,
         ROOT / "VERSION",
-        r"^\d+\.\d+\.\d+\S*",
+        _VERSION_FILE_RE,
         new_version,
         "VERSION", args.dry_run,
-    ))
+    )])
 
     # 2. __init__.py
-    results.append(update_file(
+    groups.append([partial(
+        update_file,
         ROOT / app_name / "__init__.py",
-        r'__version__\s*=\s*"[^"]+"',
+        _INIT_RE,
         f'__version__ = "{new_version}"',
         f"{app_name}/__init__.py", args.dry_run,
-    ))
+    )])
 
     # 3. frontend/package.json
-    results.append(update_json(
+    groups.append([partial(
+        update_json,
         ROOT / "frontend" / "package.json",
         "version", new_version,
         "frontend/package.json", args.dry_run,
-    ))
+    )])
 
     # 4. README.md — version badge (handles both blue and green badge styles)
-    results.append(update_file(
+    readme_jobs = [partial(
+        update_file,
         ROOT / "README.md",
-        r'version-[\d.]+-(?:blue|green)\.svg("?\s*alt="Version:\s*[\d.]+")?',
+        _BADGE_RE,
         f'version-{new_version}-blue.svg',
         "README.md badge", args.dry_run,
-    ))
+    )]
 
     # 5. README.md — alt text (if present, e.g. Watch style)
-    readme = ROOT / "README.md"
-    if readme.exists() and 'alt="Version:' in readme.read_text():
-        results.append(update_file(
-            readme,
-            r'alt="Version:\s*[^"]*"',
-            f'alt="Version: {new_version}"',
-            "README.md alt text", args.dry_run,
-        ))
+    readme_jobs.append(partial(
+        update_file,
+        ROOT / "README.md",
+        _ALT_TEXT_RE,
+        f'alt="Version: {new_version}"',
+        "README.md alt text", args.dry_run,
+        optional=True,
+    ))
+    groups.append(readme_jobs)
 
     # 6. setup.py (legacy, if present)
     setup_py = ROOT / "setup.py"
     if setup_py.exists():
-        results.append(update_file(
+        groups.append([partial(
+            update_file,
             setup_py,
-            r'version\s*=\s*"[^"]+"',
+            _SETUP_RE,
             f'version="{new_version}"',
             "setup.py", args.dry_run,
-        ))
+        )])
+
+    def run_group(jobs):
+        out = StringIO()
+        return [job(out=out) for job in jobs], out.getvalue()
+
+    results = []
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        # map() yields in submission order, keeping the report stable
+        for group_results, output in executor.map(run_group, groups):
+            results.extend(r for r in group_results if r is not None)
+            print(output, end="")
 
     ok = sum(1 for r in results if r)
     total = len(results)
@@ -353,10 +353,12 @@ doc_events = {
 			"orga.orga.webhooks.dispatcher.trigger_on_update",
 			"orga.orga.integrations.dock_calendar.sync_task",
 			"orga.orga.integrations.dock_notification.on_task_update",
+			"orga.orga.api.dashboard.clear_stats_cache",
 		],
 		"on_trash": [
 			"orga.orga.webhooks.dispatcher.trigger_on_trash",
 			"orga.orga.integrations.dock_calendar.remove_event",
+			"orga.orga.api.dashboard.clear_stats_cache",
 		],
 	},
 	"Orga Project": {
@@ -367,9 +369,13 @@ doc_events = {
 		"on_update": [
 			"orga.orga.automation.engine.run_automation",
 			"orga.orga.integrations.frappe_projects.on_orga_project_update",
-			"orga.orga.webhooks.dispatcher.trigger_on_update"
+			"orga.orga.webhooks.dispatcher.trigger_on_update",
+			"orga.orga.api.dashboard.clear_stats_cache"
 		],
-		"on_trash": "orga.orga.webhooks.dispatcher.trigger_on_trash"
+		"on_trash": [
+			"orga.orga.webhooks.dispatcher.trigger_on_trash",
+			"orga.orga.api.dashboard.clear_stats_cache"
+		]
 	},
 	"Orga Assignment": {
 		"after_insert": [
@@ -396,10 +402,12 @@ doc_events = {
 		"on_update": [
 			"orga.orga.webhooks.dispatcher.trigger_on_update",
 			"orga.orga.integrations.dock_calendar.sync_appointment",
+			"orga.orga.api.appointment.clear_my_appointments_cache",
 		],
 		"on_trash": [
 			"orga.orga.webhooks.dispatcher.trigger_on_trash",
 			"orga.orga.integrations.dock_calendar.remove_event",
+			"orga.orga.api.appointment.clear_my_appointments_cache",
 		]
 	},
 	"Orga Milestone": {
@@ -408,8 +416,12 @@ doc_events = {
 			"orga.orga.webhooks.dispatcher.trigger_on_update",
 			"orga.orga.integrations.dock_calendar.sync_milestone",
 			"orga.orga.integrations.dock_notification.on_milestone_update",
+			"orga.orga.api.dashboard.clear_stats_cache",
+		],
+		"on_trash": [
+			"orga.orga.integrations.dock_calendar.remove_event",
+			"orga.orga.api.dashboard.clear_stats_cache",
 		],
-		"on_trash": "orga.orga.integrations.dock_calendar.remove_event",
 	},
 	"Watch Entry": {
 		"on_update": "orga.orga.integrations.watch.on_watch_entry_update",
@@ -580,30 +592,61 @@ ignore_links_on_delete = []
 # Frappe's build-message-files scans .py, .js, .vue, .html but NOT .ts files.
 # This hook tells Frappe to also extract translatable strings from TypeScript files.
 
+# Underscore-prefixed so Frappe does not register these module attributes as hooks.
+import re as _re
+
+_TS_MESSAGE_PATTERN = _re.compile(r"""__\([ \t]*(['"])(.*?)\1""")
+_TS_SKIP_DIRS = frozenset({"node_modules", "dist", "build", ".git"})
+_TS_MAX_FILE_SIZE = 2 * 1024 * 1024  # bundled/minified output, not source
+
+
+def _iter_ts_files(search_dir):
+    """Yield .ts file paths under search_dir, pruning build output and oversized files."""
+    import os
+
+    stack = [search_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _TS_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".ts"):
+                        if entry.stat(follow_symlinks=False).st_size <= _TS_MAX_FILE_SIZE:
+                            yield entry.path
+        except OSError:
+            continue
+
+
 def get_messages():
     """Extract translatable strings from TypeScript files in the Vue frontend."""
+    import bisect
     import os
-    import re
 
     messages = []
-    ts_pattern = re.compile(r"""__\(\s*(['"])(.*?)\1""")
     frontend_dir = os.path.join(os.path.dirname(__file__), "public", "frontend")
     src_dir = os.path.join(os.path.dirname(__file__), "..", "frontend", "src")
 
     for search_dir in [frontend_dir, src_dir]:
         if not os.path.isdir(search_dir):
             continue
-        for root, _dirs, files in os.walk(search_dir):
-            for fname in files:
-                if not fname.endswith(".ts"):
-                    continue
-                fpath = os.path.join(root, fname)
-                try:
-                    with open(fpath, "r", encoding="utf-8") as f:
-                        for line_no, line in enumerate(f, 1):
-                            for match in ts_pattern.finditer(line):
-                                messages.append((fpath + ":" + str(line_no), match.group(2)))
-                except Exception:
-                    pass
+        for fpath in _iter_ts_files(search_dir):
+            try:
+                with open(fpath, "r", encoding="utf-8") as f:
+                    data = f.read()
+            except Exception:
+                continue
+            # Cheap substring test keeps most files out of the regex engine
+            if "__(" not in data:
+                continue
+            line_starts = [0]
+            pos = data.find("\n")
+            while pos != -1:
+                line_starts.append(pos + 1)
+                pos = data.find("\n", pos + 1)
+            for match in _TS_MESSAGE_PATTERN.finditer(data):
+                line_no = bisect.bisect_right(line_starts, match.start())
+                messages.append((fpath + ":" + str(line_no), match.group(2)))
 
     return messages
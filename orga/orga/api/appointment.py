@@ -15,9 +15,55 @@ Usage from frontend:
 """
 
 import json
+from collections import Counter
+from string import Template
 import frappe
 from frappe import _
 from frappe.utils import today, add_days, get_datetime, getdate
+from orga.orga.doctype.orga_appointment.orga_appointment import build_calendar_event
+from orga.orga.utils.doctypes import get_doc_or_throw
+from orga.orga.utils.queries import get_values_by_name
+from orga.orga.utils.users import get_initials, get_user_fullname
+
+
+MY_APPOINTMENTS_CACHE_KEY = "orga_my_appointments"
+MY_APPOINTMENTS_CACHE_TTL = 60  # seconds, bounds staleness from direct db writes and date rollover
+
+CALENDAR_BATCH_SIZE = 500  # appointments fetched per query in get_calendar_events
+
+_RSVP_STATUSES = ("Pending", "Accepted", "Declined", "Tentative")
+
+# Fields clients may set through create_appointment / update_appointment
+_ALLOWED_APPOINTMENT_FIELDS = frozenset({
+    "title", "event_type", "status", "all_day",
+    "start_datetime", "end_datetime", "location", "meeting_url",
+    "project", "task", "milestone", "description", "color",
+    "send_reminder", "reminder_minutes"
+})
+
+# Invitation email body; labels come from _get_invitation_labels
+_INVITATION_TEMPLATE = Template("""
+    <p>$greeting,</p>
+
+    <p>$invited:</p>
+
+    <div style="background: #f8f9fa; padding: 16px; border-radius: 8px; margin: 16px 0; border-left: 4px solid #8B5CF6;">
+        <h3 style="margin: 0 0 12px 0; color: #333;">$title</h3>
+        <p style="margin: 4px 0;"><strong>$type_label:</strong> $event_type</p>
+        <p style="margin: 4px 0;"><strong>$date_label:</strong> $date</p>
+        <p style="margin: 4px 0;"><strong>$time_label:</strong> $time$end_time_info</p>
+        <p style="margin: 4px 0;"><strong>$organizer_label:</strong> $organizer_name</p>
+        <p style="margin: 4px 0;"><strong>$attendance_label:</strong> <span style="color: $attendance_color;">$attendance_type</span></p>
+        $location_info
+        $project_info
+    </div>
+
+    $description_info
+
+    <p style="margin-top: 20px;">$respond.</p>
+
+    <p>$regards,<br>Orga</p>
+    """)
 
 
 @frappe.whitelist()
@@ -47,58 +93,68 @@ def get_appointments(
     Returns:
         dict: {appointments: [...], total: int}
     """
-    filters = {}
+    conditions = []
+    values = {"limit": int(limit), "offset": int(offset)}
     if project:
-        filters["project"] = project
+        conditions.append("project = %(project)s")
+        values["project"] = project
     if event_type:
-        filters["event_type"] = event_type
+        conditions.append("event_type = %(event_type)s")
+        values["event_type"] = event_type
     if status:
-        filters["status"] = status
+        conditions.append("status = %(status)s")
+        values["status"] = status
     if start_date:
-        filters["start_datetime"] = [">=", start_date]
+        conditions.append("start_datetime >= %(start_date)s")
+        values["start_date"] = start_date
     if end_date:
-        if "start_datetime" in filters:
-            filters["start_datetime"] = ["between", [start_date, end_date + " 23:59:59"]]
-        else:
-            filters["start_datetime"] = ["<=", end_date + " 23:59:59"]
-
-    appointments = frappe.get_all(
-        "Orga Appointment",
-        filters=filters,
-        fields=[
-            "name", "title", "event_type", "status", "all_day",
-            "start_datetime", "end_datetime", "duration_minutes",
-            "project", "task", "location", "meeting_url", "color"
-        ],
-        order_by="start_datetime asc",
-        limit_page_length=int(limit),
-        limit_start=int(offset)
+        conditions.append("start_datetime <= %(end_date)s")
+        values["end_date"] = end_date + " 23:59:59"
+    # Filter by attendee resource in the query so limit/offset and total agree
+    if resource:
+        conditions.append("""name IN (
+            SELECT parent FROM `tabOrga Appointment Attendee`
+            WHERE resource = %(resource)s AND parenttype = 'Orga Appointment'
+        )""")
+        values["resource"] = resource
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    # COUNT(*) OVER() returns the unpaginated total on every row, saving
+    # a second query with the same filters
+    appointments = frappe.db.sql(f"""
+        SELECT
+            name, title, event_type, status, all_day,
+            start_datetime, end_datetime, duration_minutes,
+            project, task, location, meeting_url, color,
+            COUNT(*) OVER() as total_count
+        FROM `tabOrga Appointment`
+        {where_clause}
+        ORDER BY start_datetime asc
+        LIMIT %(limit)s OFFSET %(offset)s
+    """, values, as_dict=True)
+
+    if appointments:
+        total = appointments[0].total_count
+    elif not int(offset):
+        total = 0
+    else:
+        # Empty page past the end: no row to carry the total
+        total = frappe.db.sql(f"""
+            SELECT COUNT(*) FROM `tabOrga Appointment` {where_clause}
+        """, values)[0][0]
+
+    # Enrich with project name and attendee count (one query each for the page)
+    project_names = get_values_by_name(
+        "Orga Project", [a.get("project") for a in appointments], "project_name"
     )
+    rsvp_counts = _get_rsvp_counts([a["name"] for a in appointments])
 
-    total = frappe.db.count("Orga Appointment", filters)
-
-    # Enrich with project name and attendee count
     for apt in appointments:
+        apt.pop("total_count")
         if apt.get("project"):
-            apt["project_name"] = frappe.db.get_value(
-                "Orga Project", apt["project"], "project_name"
-            )
-
-        # Get attendee count
-        apt["attendee_count"] = frappe.db.count(
-            "Orga Appointment Attendee",
-            {"parent": apt["name"]}
-        )
-
-    # Post-filter by resource if specified
-    if resource:
-        resource_appointments = frappe.get_all(
-            "Orga Appointment Attendee",
-            filters={"resource": resource},
-            fields=["parent"],
-            pluck="parent"
-        )
-        appointments = [a for a in appointments if a["name"] in resource_appointments]
+            apt["project_name"] = project_names.get(apt["project"])
+        apt["attendee_count"] = rsvp_counts.get(apt["name"], {}).get("total", 0)
 
     return {
         "appointments": appointments,
@@ -120,36 +176,48 @@ def get_appointment(name):
     if not name:
         frappe.throw(_("Appointment name is required"))
 
-    if not frappe.db.exists("Orga Appointment", name):
-        frappe.throw(_("Appointment {0} not found").format(name), frappe.DoesNotExistError)
+    doc = _get_appointment_doc(name)
+    return _serialize_appointment(doc)
+
+
+def _get_appointment_doc(name):
+    """Load an appointment, throwing a translated DoesNotExistError if it is missing."""
+    return get_doc_or_throw(
+        "Orga Appointment", name, _("Appointment {0} not found").format(name)
+    )
+
 
-    doc = frappe.get_doc("Orga Appointment", name)
+def _serialize_appointment(doc):
+    """Build the get_appointment payload from a loaded appointment document."""
     appointment = doc.as_dict()
 
     # Get attendees with resource details
+    resources = get_values_by_name(
+        "Orga Resource", [a.resource for a in doc.attendees], ["resource_name", "email"]
+    )
     attendees = []
     for attendee in doc.attendees:
-        resource = frappe.get_doc("Orga Resource", attendee.resource)
+        resource = resources.get(attendee.resource, {})
         attendees.append({
             "name": attendee.name,
             "resource": attendee.resource,
-            "resource_name": resource.resource_name,
-            "email": resource.email,
+            "resource_name": resource.get("resource_name"),
+            "email": resource.get("email"),
             "rsvp_status": attendee.rsvp_status,
             "required": attendee.required,
             "notes": attendee.notes,
-            "initials": get_initials(resource.resource_name)
+            "initials": get_initials(resource.get("resource_name"))
         })
 
     appointment["attendees"] = attendees
 
     # Get project/task names
     if appointment.get("project"):
-        appointment["project_name"] = frappe.db.get_value(
+        appointment["project_name"] = frappe.get_cached_value(
             "Orga Project", appointment["project"], "project_name"
         )
     if appointment.get("task"):
-        appointment["task_subject"] = frappe.db.get_value(
+        appointment["task_subject"] = frappe.get_cached_value(
             "Orga Task", appointment["task"], "subject"
         )
 
@@ -178,17 +246,8 @@ def create_appointment(data):
     # Handle attendees
     attendees = data.pop("attendees", [])
 
-    allowed_fields = [
-        "title", "event_type", "status", "all_day",
-        "start_datetime", "end_datetime", "location", "meeting_url",
-        "project", "task", "milestone", "description", "color",
-        "send_reminder", "reminder_minutes"
-    ]
-
     doc_data = {"doctype": "Orga Appointment"}
-    for field in allowed_fields:
-        if field in data:
-            doc_data[field] = data[field]
+    doc_data.update({k: v for k, v in data.items() if k in _ALLOWED_APPOINTMENT_FIELDS})
 
     doc = frappe.get_doc(doc_data)
 
@@ -203,7 +262,7 @@ def create_appointment(data):
     doc.insert()
     frappe.db.commit()
 
-    return get_appointment(doc.name)
+    return _serialize_appointment(doc)
 
 
 @frappe.whitelist()
@@ -224,26 +283,16 @@ def update_appointment(name, data):
     if isinstance(data, str):
         data = json.loads(data)
 
-    if not frappe.db.exists("Orga Appointment", name):
-        frappe.throw(_("Appointment {0} not found").format(name), frappe.DoesNotExistError)
-
-    doc = frappe.get_doc("Orga Appointment", name)
-
-    allowed_fields = [
-        "title", "event_type", "status", "all_day",
-        "start_datetime", "end_datetime", "location", "meeting_url",
-        "project", "task", "milestone", "description", "color",
-        "send_reminder", "reminder_minutes"
-    ]
+    doc = _get_appointment_doc(name)
 
     for field, value in data.items():
-        if field in allowed_fields:
+        if field in _ALLOWED_APPOINTMENT_FIELDS:
             setattr(doc, field, value)
 
     doc.save()
     frappe.db.commit()
 
-    return get_appointment(doc.name)
+    return _serialize_appointment(doc)
 
 
 @frappe.whitelist()
@@ -260,10 +309,8 @@ def delete_appointment(name):
     if not name:
         frappe.throw(_("Appointment name is required"))
 
-    if not frappe.db.exists("Orga Appointment", name):
-        frappe.throw(_("Appointment {0} not found").format(name), frappe.DoesNotExistError)
-
-    frappe.delete_doc("Orga Appointment", name)
+    doc = _get_appointment_doc(name)
+    frappe.delete_doc("Orga Appointment", doc.name)
     frappe.db.commit()
 
     return {"success": True}
@@ -294,25 +341,61 @@ def get_calendar_events(start_date, end_date, project=None, resource=None, event
     if event_type:
         filters["event_type"] = event_type
 
-    appointments = frappe.get_all(
-        "Orga Appointment",
-        filters=filters,
-        fields=["name"]
-    )
+    # Resolve the resource filter up front instead of loading every document
+    if resource:
+        resource_appointments = frappe.get_all(
+            "Orga Appointment Attendee",
+            filters={"resource": resource},
+            pluck="parent"
+        )
+        if not resource_appointments:
+            return []
+        filters["name"] = ["in", resource_appointments]
 
-    events = []
-    for apt in appointments:
-        doc = frappe.get_doc("Orga Appointment", apt.name)
+    return list(_iter_calendar_events(filters))
 
-        # Filter by resource if specified
-        if resource:
-            attendee_resources = [a.resource for a in doc.attendees]
-            if resource not in attendee_resources:
-                continue
 
-        events.append(doc.get_calendar_event_data())
+def _iter_calendar_events(filters, batch_size=CALENDAR_BATCH_SIZE):
+    """
+    Yield calendar events for the matching appointments, one page at a time.
 
-    return events
+    Each page gets its own project name and RSVP count queries, so long date
+    ranges keep the IN lists and the rows held in memory bounded.
+    """
+    offset = 0
+    while True:
+        appointments = frappe.get_all(
+            "Orga Appointment",
+            filters=filters,
+            fields=[
+                "name", "title", "event_type", "status", "all_day",
+                "start_datetime", "end_datetime", "color",
+                "project", "location", "meeting_url"
+            ],
+            order_by="start_datetime asc, name asc",
+            limit_start=offset,
+            limit_page_length=batch_size
+        )
+        if not appointments:
+            return
+
+        project_names = get_values_by_name(
+            "Orga Project", [a.get("project") for a in appointments], "project_name"
+        )
+        rsvp_counts = _get_rsvp_counts([a.name for a in appointments])
+
+        for apt in appointments:
+            counts = rsvp_counts.get(apt.name, {})
+            yield build_calendar_event(
+                apt,
+                project_names.get(apt.project),
+                counts.get("total", 0),
+                counts.get("accepted", 0)
+            )
+
+        if len(appointments) < batch_size:
+            return
+        offset += batch_size
 
 
 @frappe.whitelist()
@@ -328,28 +411,34 @@ def get_my_appointments(status=None, upcoming_only=True, limit=20):
     Returns:
         list: User's appointments
     """
-    # Get current user's resource
-    user_resource = frappe.db.get_value(
-        "Orga Resource",
-        {"user": frappe.session.user},
-        "name"
-    )
+    cache_key = _my_appointments_cache_key(frappe.session.user, status, upcoming_only, limit)
+    cached = frappe.cache.get_value(cache_key)
+    if cached is not None:
+        return cached
+
+    appointments = _get_my_appointments(status, upcoming_only, limit)
+    frappe.cache.set_value(cache_key, appointments, expires_in_sec=MY_APPOINTMENTS_CACHE_TTL)
+    return appointments
+
+
+def _get_my_appointments(status, upcoming_only, limit):
+    user_resource = _get_session_resource()
 
     if not user_resource:
         return []
 
-    # Find appointments where user is an attendee
-    attendee_entries = frappe.get_all(
+    # Find appointments where user is an attendee, with their RSVP for each
+    my_rsvps = dict(frappe.get_all(
         "Orga Appointment Attendee",
         filters={"resource": user_resource},
-        fields=["parent"],
-        pluck="parent"
-    )
+        fields=["parent", "rsvp_status"],
+        as_list=True
+    ))
 
-    if not attendee_entries:
+    if not my_rsvps:
         return []
 
-    filters = {"name": ["in", attendee_entries]}
+    filters = {"name": ["in", list(my_rsvps)]}
 
     if status:
         filters["status"] = status
@@ -369,23 +458,50 @@ def get_my_appointments(status=None, upcoming_only=True, limit=20):
         limit_page_length=int(limit)
     )
 
-    # Enrich with RSVP status
+    # Enrich with RSVP status and project name
+    project_names = get_values_by_name(
+        "Orga Project", [a.get("project") for a in appointments], "project_name"
+    )
     for apt in appointments:
-        rsvp = frappe.db.get_value(
-            "Orga Appointment Attendee",
-            {"parent": apt["name"], "resource": user_resource},
-            "rsvp_status"
-        )
-        apt["my_rsvp"] = rsvp
-
+        apt["my_rsvp"] = my_rsvps.get(apt["name"])
         if apt.get("project"):
-            apt["project_name"] = frappe.db.get_value(
-                "Orga Project", apt["project"], "project_name"
-            )
+            apt["project_name"] = project_names.get(apt["project"])
 
     return appointments
 
 
+def _my_appointments_cache_key(user, *args):
+    """Cache key for get_my_appointments; the user prefix allows per-user invalidation."""
+    return ":".join([MY_APPOINTMENTS_CACHE_KEY, user, *(str(a) for a in args)])
+
+
+def clear_my_appointments_cache(doc=None, method=None):
+    """
+    Doc event hook: drop cached get_my_appointments results for every
+    attendee of the appointment, including attendees removed by this save.
+    """
+    attendees = list(doc.get("attendees") or [])
+    before = doc.get_doc_before_save() if method == "on_update" else None
+    if before:
+        attendees += before.get("attendees") or []
+
+    users = {a.user for a in attendees if a.user}
+    resources = list({a.resource for a in attendees if a.resource})
+    if resources:
+        users.update(frappe.get_all(
+            "Orga Resource",
+            filters={"name": ["in", resources], "user": ["is", "set"]},
+            pluck="user"
+        ))
+
+    for user in users:
+        _clear_my_appointments_cache_for(user)
+
+
+def _clear_my_appointments_cache_for(user):
+    frappe.cache.delete_keys(_my_appointments_cache_key(user, ""))
+
+
 @frappe.whitelist()
 def update_rsvp(appointment_name, rsvp_status):
     """
@@ -401,37 +517,31 @@ def update_rsvp(appointment_name, rsvp_status):
     if not appointment_name:
         frappe.throw(_("Appointment name is required"))
 
-    if rsvp_status not in ["Pending", "Accepted", "Declined", "Tentative"]:
+    if rsvp_status not in _RSVP_STATUSES:
         frappe.throw(_("Invalid RSVP status"))
 
-    # Get current user's resource
-    user_resource = frappe.db.get_value(
-        "Orga Resource",
-        {"user": frappe.session.user},
-        "name"
-    )
-
-    if not user_resource:
-        frappe.throw(_("You are not linked to any resource"))
-
-    # Find attendee entry
-    attendee = frappe.db.get_value(
-        "Orga Appointment Attendee",
-        {"parent": appointment_name, "resource": user_resource},
-        "name"
-    )
+    # Find the session user's attendee row through Orga Resource.user in one query
+    attendee = frappe.db.sql("""
+        SELECT att.name
+        FROM `tabOrga Appointment Attendee` att
+        INNER JOIN `tabOrga Resource` r ON r.name = att.resource
+        WHERE att.parent = %(appointment)s
+            AND att.parenttype = 'Orga Appointment'
+            AND r.user = %(user)s
+        LIMIT 1
+    """, {"appointment": appointment_name, "user": frappe.session.user})
 
     if not attendee:
+        # Work out which error applies only on the failure path
+        if not _get_session_resource():
+            frappe.throw(_("You are not linked to any resource"))
         frappe.throw(_("You are not an attendee of this appointment"))
 
-    # Update RSVP
-    frappe.db.set_value(
-        "Orga Appointment Attendee",
-        attendee,
-        "rsvp_status",
-        rsvp_status
-    )
+    frappe.db.set_value("Orga Appointment Attendee", attendee[0][0], "rsvp_status", rsvp_status)
     frappe.db.commit()
+    # The child row is written directly, so no doc hook clears the caches
+    frappe.clear_document_cache("Orga Appointment", appointment_name)
+    _clear_my_appointments_cache_for(frappe.session.user)
 
     return {"success": True, "rsvp_status": rsvp_status}
 
@@ -452,21 +562,17 @@ def add_attendee(appointment_name, resource, required=1):
     if not appointment_name or not resource:
         frappe.throw(_("Appointment and resource are required"))
 
-    if not frappe.db.exists("Orga Appointment", appointment_name):
-        frappe.throw(_("Appointment not found"), frappe.DoesNotExistError)
+    doc = _get_appointment_doc(appointment_name)
 
     if not frappe.db.exists("Orga Resource", resource):
         frappe.throw(_("Resource not found"), frappe.DoesNotExistError)
 
-    # Check if already an attendee
-    existing = frappe.db.exists(
-        "Orga Appointment Attendee",
-        {"parent": appointment_name, "resource": resource}
-    )
-    if existing:
+    # Check if already an attendee (the child rows are already loaded)
+    if any(a.resource == resource for a in doc.attendees):
         frappe.throw(_("Resource is already an attendee"))
 
-    doc = frappe.get_doc("Orga Appointment", appointment_name)
+    # Saved through the parent so on_update hooks (Dock calendar sync,
+    # webhooks) see the new attendee
     doc.append("attendees", {
         "resource": resource,
         "rsvp_status": "Pending",
@@ -475,7 +581,7 @@ def add_attendee(appointment_name, resource, required=1):
     doc.save()
     frappe.db.commit()
 
-    return get_appointment(appointment_name)
+    return _serialize_appointment(doc)
 
 
 @frappe.whitelist()
@@ -493,22 +599,45 @@ def remove_attendee(appointment_name, resource):
     if not appointment_name or not resource:
         frappe.throw(_("Appointment and resource are required"))
 
-    doc = frappe.get_doc("Orga Appointment", appointment_name)
-    doc.attendees = [a for a in doc.attendees if a.resource != resource]
+    doc = _get_appointment_doc(appointment_name)
+    remaining = [a for a in doc.attendees if a.resource != resource]
+
+    # Nothing to remove: skip the save and its hooks
+    if len(remaining) == len(doc.attendees):
+        return {"success": True}
+
+    # Saved through the parent so the Dock calendar sync drops the removed
+    # attendee's event and the webhooks fire
+    doc.attendees = remaining
     doc.save()
     frappe.db.commit()
 
     return {"success": True}
 
 
-def get_initials(name):
-    """Helper to get initials from a name"""
-    if not name:
-        return "?"
-    parts = name.split()
-    if len(parts) >= 2:
-        return (parts[0][0] + parts[-1][0]).upper()
-    return name[:2].upper()
+def _get_session_resource():
+    """Get the session user's Orga Resource name, cached for the current request."""
+    cache = frappe.local.__dict__.setdefault("_orga_session_resource", {})
+    user = frappe.session.user
+    if user not in cache:
+        cache[user] = frappe.db.get_value("Orga Resource", {"user": user}, "name")
+    return cache[user]
+
+
+def _get_rsvp_counts(appointment_names) -> dict:
+    """Map appointment names to {total, accepted} attendee counts with a single query."""
+    if not appointment_names:
+        return {}
+    rows = frappe.db.sql("""
+        SELECT
+            parent,
+            COUNT(*) as total,
+            COALESCE(SUM(CASE WHEN rsvp_status = 'Accepted' THEN 1 ELSE 0 END), 0) as accepted
+        FROM `tabOrga Appointment Attendee`
+        WHERE parent IN %s
+        GROUP BY parent
+    """, (tuple(appointment_names),), as_dict=True)
+    return {row.parent: row for row in rows}
 
 
 @frappe.whitelist()
@@ -525,10 +654,7 @@ def send_invitations(appointment_name):
     if not appointment_name:
         frappe.throw(_("Appointment name is required"))
 
-    if not frappe.db.exists("Orga Appointment", appointment_name):
-        frappe.throw(_("Appointment not found"), frappe.DoesNotExistError)
-
-    doc = frappe.get_doc("Orga Appointment", appointment_name)
+    doc = _get_appointment_doc(appointment_name)
 
     if not doc.attendees:
         return {"success": True, "sent_count": 0, "failed": []}
@@ -536,28 +662,30 @@ def send_invitations(appointment_name):
     # Get organizer info
     organizer_name = "Orga"
     if doc.created_by:
-        organizer_name = frappe.db.get_value("User", doc.created_by, "full_name") or doc.created_by
+        organizer_name = frappe.get_cached_value("User", doc.created_by, "full_name") or doc.created_by
 
     # Format appointment details
     start_dt = get_datetime(doc.start_datetime)
     formatted_date = start_dt.strftime("%A, %B %d, %Y")
     formatted_time = start_dt.strftime("%I:%M %p")
+    formatted_end_time = None
+    if doc.end_datetime:
+        formatted_end_time = get_datetime(doc.end_datetime).strftime("%I:%M %p")
 
     # Get project name
     project_name = None
     if doc.project:
-        project_name = frappe.db.get_value("Orga Project", doc.project, "project_name")
+        project_name = frappe.get_cached_value("Orga Project", doc.project, "project_name")
 
     sent_count = 0
     failed = []
 
+    resources = get_values_by_name(
+        "Orga Resource", [a.resource for a in doc.attendees], ["resource_name", "email"]
+    )
+
     for attendee in doc.attendees:
-        resource = frappe.db.get_value(
-            "Orga Resource",
-            attendee.resource,
-            ["resource_name", "email"],
-            as_dict=True
-        )
+        resource = resources.get(attendee.resource)
 
         if not resource or not resource.email:
             failed.append({
@@ -575,6 +703,7 @@ def send_invitations(appointment_name):
                 project_name=project_name,
                 formatted_date=formatted_date,
                 formatted_time=formatted_time,
+                formatted_end_time=formatted_end_time,
                 is_required=attendee.required
             )
             sent_count += 1
@@ -595,8 +724,33 @@ def send_invitations(appointment_name):
     }
 
 
+def _get_invitation_labels() -> dict:
+    """Translated invitation labels, built once per request and language."""
+    cache = frappe.local.__dict__.setdefault("_orga_invitation_labels", {})
+    lang = frappe.local.lang
+    if lang not in cache:
+        cache[lang] = {
+            "invited": _("You have been invited to the following appointment"),
+            "type_label": _("Type"),
+            "date_label": _("Date"),
+            "time_label": _("Time"),
+            "organizer_label": _("Organizer"),
+            "attendance_label": _("Your attendance"),
+            "required": _("Required"),
+            "optional": _("Optional"),
+            "location": _("Location"),
+            "meeting_link": _("Meeting Link"),
+            "project": _("Project"),
+            "details": _("Details"),
+            "respond": _("Please respond to this invitation in Orga"),
+            "regards": _("Best regards"),
+        }
+    return cache[lang]
+
+
 def send_invitation_email(recipient, recipient_name, appointment, organizer_name,
-                          project_name, formatted_date, formatted_time, is_required):
+                          project_name, formatted_date, formatted_time, is_required,
+                          formatted_end_time=None):
     """
     Send an invitation email to a single attendee.
 
@@ -609,64 +763,52 @@ def send_invitation_email(recipient, recipient_name, appointment, organizer_name
         formatted_date: Human-readable date string
         formatted_time: Human-readable time string
         is_required: Whether attendance is required
+        formatted_end_time: Human-readable end time string, if any
     """
+    labels = _get_invitation_labels()
     subject = _("Invitation: {0} - {1} at {2}").format(appointment.title, formatted_date, formatted_time)
 
-    # Build attendance requirement string
-    attendance_type = _("Required") if is_required else _("Optional")
-
     # Build location info
     location_info = ""
     if appointment.location:
-        location_info = f"<p><strong>{_('Location')}:</strong> {appointment.location}</p>"
+        location_info = f"<p><strong>{labels['location']}:</strong> {appointment.location}</p>"
     if appointment.meeting_url:
-        location_info += f'<p><strong>{_("Meeting Link")}:</strong> <a href="{appointment.meeting_url}">{appointment.meeting_url}</a></p>'
+        location_info += f'<p><strong>{labels["meeting_link"]}:</strong> <a href="{appointment.meeting_url}">{appointment.meeting_url}</a></p>'
 
     # Build project info
     project_info = ""
     if project_name:
-        project_info = f"<p><strong>{_('Project')}:</strong> {project_name}</p>"
+        project_info = f"<p><strong>{labels['project']}:</strong> {project_name}</p>"
 
     # Build description
     description_info = ""
     if appointment.description:
-        description_info = f"<hr><p><strong>{_('Details')}:</strong></p><div>{appointment.description}</div>"
-
-    # Calculate end time
-    end_time_info = ""
-    if appointment.end_datetime:
-        end_dt = get_datetime(appointment.end_datetime)
-        end_time_str = end_dt.strftime("%I:%M %p")
-        end_time_info = f" - {end_time_str}"
-
-    message = f"""
-    <p>{_("Hello {0}").format(recipient_name)},</p>
-
-    <p>{_("You have been invited to the following appointment")}:</p>
-
-    <div style="background: #f8f9fa; padding: 16px; border-radius: 8px; margin: 16px 0; border-left: 4px solid #8B5CF6;">
-        <h3 style="margin: 0 0 12px 0; color: #333;">{appointment.title}</h3>
-        <p style="margin: 4px 0;"><strong>{_("Type")}:</strong> {appointment.event_type}</p>
-        <p style="margin: 4px 0;"><strong>{_("Date")}:</strong> {formatted_date}</p>
-        <p style="margin: 4px 0;"><strong>{_("Time")}:</strong> {formatted_time}{end_time_info}</p>
-        <p style="margin: 4px 0;"><strong>{_("Organizer")}:</strong> {organizer_name}</p>
-        <p style="margin: 4px 0;"><strong>{_("Your attendance")}:</strong> <span style="color: {'#dc2626' if is_required else '#6b7280'};">{attendance_type}</span></p>
-        {location_info}
-        {project_info}
-    </div>
-
-    {description_info}
-
-    <p style="margin-top: 20px;">{_("Please respond to this invitation in Orga")}.</p>
-
-    <p>{_("Best regards")},<br>Orga</p>
-    """
+        description_info = f"<hr><p><strong>{labels['details']}:</strong></p><div>{appointment.description}</div>"
+
+    end_time_info = f" - {formatted_end_time}" if formatted_end_time else ""
+
+    message = _INVITATION_TEMPLATE.substitute(
+        labels,
+        greeting=_("Hello {0}").format(recipient_name),
+        title=appointment.title,
+        event_type=appointment.event_type,
+        date=formatted_date,
+        time=formatted_time,
+        end_time_info=end_time_info,
+        organizer_name=organizer_name,
+        attendance_color="#dc2626" if is_required else "#6b7280",
+        attendance_type=labels["required"] if is_required else labels["optional"],
+        location_info=location_info,
+        project_info=project_info,
+        description_info=description_info
+    )
 
+    # Queued rather than sent inline so the request does not wait on SMTP
+    # once per attendee; the Email Queue worker delivers it
     frappe.sendmail(
         recipients=[recipient],
         subject=subject,
-        message=message,
-        now=True
+        message=message
     )
 
 
@@ -682,14 +824,11 @@ def create_appointment_with_invitations(data, send_invites=True):
     Returns:
         dict: Created appointment data with invitation status
     """
-    if isinstance(data, str):
-        data = json.loads(data)
-
     if isinstance(send_invites, str):
         send_invites = send_invites.lower() in ['true', '1', 'yes']
 
-    # Create the appointment
-    appointment = create_appointment(json.dumps(data))
+    # Create the appointment (create_appointment parses JSON strings itself)
+    appointment = create_appointment(data)
 
     # Send invitations if requested and there are attendees
     invitation_result = None
@@ -732,32 +871,13 @@ def update_rsvp_enhanced(appointment: str, status: str, note: str = None) -> dic
     if not appointment:
         frappe.throw(_("Appointment name is required"))
 
-    valid_statuses = ["Pending", "Accepted", "Declined", "Tentative"]
-    if status not in valid_statuses:
-        frappe.throw(_("Invalid status. Must be one of: {0}").format(", ".join(valid_statuses)))
-
-    if not frappe.db.exists("Orga Appointment", appointment):
-        frappe.throw(_("Appointment {0} not found").format(appointment), frappe.DoesNotExistError)
+    if status not in _RSVP_STATUSES:
+        frappe.throw(_("Invalid status. Must be one of: {0}").format(", ".join(_RSVP_STATUSES)))
 
-    doc = frappe.get_doc("Orga Appointment", appointment)
+    doc = _get_appointment_doc(appointment)
 
     # Find current user in attendees (by user field or resource.user)
-    attendee = None
-    attendee_idx = None
-
-    for idx, att in enumerate(doc.attendees):
-        # Check direct user link
-        if att.user == frappe.session.user:
-            attendee = att
-            attendee_idx = idx
-            break
-        # Check via resource
-        if att.resource:
-            resource_user = frappe.db.get_value("Orga Resource", att.resource, "user")
-            if resource_user == frappe.session.user:
-                attendee = att
-                attendee_idx = idx
-                break
+    attendee = _find_current_attendee(doc.attendees)
 
     if not attendee:
         frappe.throw(_("You are not an attendee of this appointment"))
@@ -780,8 +900,8 @@ def update_rsvp_enhanced(appointment: str, status: str, note: str = None) -> dic
         _notify_rsvp_change(doc, frappe.session.user, old_status, status)
 
     # Get updated attendee info
-    attendees = _get_attendee_list(doc)
-    stats = _get_attendee_stats(doc)
+    attendees = _get_attendee_list(doc.attendees)
+    stats = _get_attendee_stats(doc.attendees)
 
     return {
         "status": status,
@@ -815,22 +935,10 @@ def propose_new_time(
     if not proposed_start or not proposed_end:
         frappe.throw(_("Both proposed start and end times are required"))
 
-    if not frappe.db.exists("Orga Appointment", appointment):
-        frappe.throw(_("Appointment {0} not found").format(appointment), frappe.DoesNotExistError)
-
-    doc = frappe.get_doc("Orga Appointment", appointment)
+    doc = _get_appointment_doc(appointment)
 
     # Find current user in attendees
-    attendee = None
-    for att in doc.attendees:
-        if att.user == frappe.session.user:
-            attendee = att
-            break
-        if att.resource:
-            resource_user = frappe.db.get_value("Orga Resource", att.resource, "user")
-            if resource_user == frappe.session.user:
-                attendee = att
-                break
+    attendee = _find_current_attendee(doc.attendees)
 
     if not attendee:
         frappe.throw(_("You are not an attendee of this appointment"))
@@ -851,17 +959,18 @@ def propose_new_time(
         "status": "Tentative",
         "proposed_start": proposed_start,
         "proposed_end": proposed_end,
-        "attendee_stats": _get_attendee_stats(doc)
+        "attendee_stats": _get_attendee_stats(doc.attendees)
     }
 
 
 @frappe.whitelist()
-def get_appointment_rsvp_info(appointment: str) -> dict:
+def get_appointment_rsvp_info(appointment: str, include_attendees=True) -> dict:
     """
     Get RSVP information for an appointment (for activity cards).
 
     Args:
         appointment: Orga Appointment name
+        include_attendees: Include the attendee roster (default: True)
 
     Returns:
         dict: {
@@ -874,81 +983,105 @@ def get_appointment_rsvp_info(appointment: str) -> dict:
     if not appointment:
         frappe.throw(_("Appointment name is required"))
 
-    if not frappe.db.exists("Orga Appointment", appointment):
-        return {
-            "is_attendee": False,
-            "user_rsvp_status": None,
-            "attendee_stats": {"total": 0, "accepted": 0, "declined": 0, "tentative": 0, "pending": 0},
-            "attendees": []
-        }
+    if isinstance(include_attendees, str):
+        include_attendees = include_attendees.lower() in ['true', '1', 'yes']
 
-    doc = frappe.get_doc("Orga Appointment", appointment)
+    # Only the attendee rows are needed, so skip loading the whole document.
+    # A missing appointment simply has no rows, giving the empty payload.
+    rows = frappe.get_all(
+        "Orga Appointment Attendee",
+        filters={"parent": appointment, "parenttype": "Orga Appointment"},
+        fields=[
+            "resource", "resource_name", "user", "rsvp_status", "required",
+            "proposed_start", "proposed_end"
+        ],
+        order_by="idx asc"
+    )
 
     # Find current user's status
-    is_attendee = False
-    user_rsvp_status = None
-
-    for att in doc.attendees:
-        if att.user == frappe.session.user:
-            is_attendee = True
-            user_rsvp_status = att.rsvp_status
-            break
-        if att.resource:
-            resource_user = frappe.db.get_value("Orga Resource", att.resource, "user")
-            if resource_user == frappe.session.user:
-                is_attendee = True
-                user_rsvp_status = att.rsvp_status
-                break
+    attendee = _find_current_attendee(rows)
 
     return {
-        "is_attendee": is_attendee,
-        "user_rsvp_status": user_rsvp_status,
-        "attendee_stats": _get_attendee_stats(doc),
-        "attendees": _get_attendee_list(doc)
+        "is_attendee": bool(attendee),
+        "user_rsvp_status": attendee.rsvp_status if attendee else None,
+        "attendee_stats": _get_attendee_stats(rows),
+        "attendees": _get_attendee_list(rows) if include_attendees else []
     }
 
 
-def _get_attendee_stats(doc) -> dict:
-    """Get RSVP statistics for appointment."""
-    stats = {
-        "total": len(doc.attendees),
-        "accepted": 0,
-        "declined": 0,
-        "tentative": 0,
-        "pending": 0
-    }
+def _find_current_attendee(rows):
+    """
+    Find the session user's attendee row, linked directly by user or through
+    its resource. Resource links are resolved with one query for all rows.
+    """
+    user = frappe.session.user
+    for att in rows:
+        if att.user == user:
+            return att
 
-    for att in doc.attendees:
-        status_key = (att.rsvp_status or "Pending").lower()
-        if status_key in stats:
-            stats[status_key] += 1
+    resource_ids = list({a.resource for a in rows if a.resource})
+    if not resource_ids:
+        return None
 
+    my_resources = set(frappe.get_all(
+        "Orga Resource",
+        filters={"name": ["in", resource_ids], "user": user},
+        pluck="name"
+    ))
+    for att in rows:
+        if att.resource in my_resources:
+            return att
+    return None
+
+
+def _get_attendee_stats(rows) -> dict:
+    """Get RSVP statistics for appointment attendee rows."""
+    counts = Counter(att.rsvp_status or "Pending" for att in rows)
+    stats = {"total": len(rows)}
+    for status in _RSVP_STATUSES:
+        stats[status.lower()] = counts.get(status, 0)
     return stats
 
 
-def _get_attendee_list(doc) -> list:
-    """Get list of attendees with their info."""
+def _get_attendee_list(rows) -> list:
+    """Get list of attendees with their info from appointment attendee rows."""
+    # Resolve resources, then all users (direct and via resource), in two queries
+    resource_ids = list({a.resource for a in rows if a.resource and not a.user})
+    resources = {}
+    if resource_ids:
+        resources = {r.name: r for r in frappe.get_all(
+            "Orga Resource",
+            filters={"name": ["in", resource_ids]},
+            fields=["name", "resource_name", "user"]
+        )}
+
+    user_ids = {a.user for a in rows if a.user}
+    user_ids.update(r.user for r in resources.values() if r.user)
+    users = {}
+    if user_ids:
+        users = {u.name: u for u in frappe.get_all(
+            "User",
+            filters={"name": ["in", list(user_ids)]},
+            fields=["name", "full_name", "user_image"]
+        )}
+
     attendees = []
-    for att in doc.attendees:
+    for att in rows:
         # Get name from resource or user
         name = att.resource_name
         user_image = None
 
         if att.user:
-            user_info = frappe.db.get_value(
-                "User", att.user, ["full_name", "user_image"], as_dict=True
-            )
+            user_info = users.get(att.user)
             if user_info:
-                name = user_info.get("full_name") or name
-                user_image = user_info.get("user_image")
+                name = user_info.full_name or name
+                user_image = user_info.user_image
         elif att.resource:
-            resource_info = frappe.db.get_value(
-                "Orga Resource", att.resource, ["resource_name", "user"], as_dict=True
-            )
+            resource_info = resources.get(att.resource)
             if resource_info:
-                name = resource_info.get("resource_name") or name
-                if resource_info.get("user"):
-                    user_image = frappe.db.get_value("User", resource_info["user"], "user_image")
+                name = resource_info.resource_name or name
+                if resource_info.user and resource_info.user in users:
+                    user_image = users[resource_info.user].user_image
 
         attendees.append({
             "resource": att.resource,
@@ -967,7 +1100,7 @@ def _get_attendee_list(doc) -> list:
 def _notify_rsvp_change(doc, user: str, old_status: str, new_status: str) -> None:
     """Send notification when RSVP status changes."""
     try:
-        user_fullname = frappe.db.get_value("User", user, "full_name") or user
+        user_fullname = get_user_fullname(user)
 
         # Notify the appointment owner
         if doc.owner and doc.owner != user:
@@ -981,7 +1114,8 @@ def _notify_rsvp_change(doc, user: str, old_status: str, new_status: str) -> Non
                     "old_status": old_status,
                     "new_status": new_status
                 },
-                user=doc.owner
+                user=doc.owner,
+                after_commit=True
             )
     except Exception as e:
         frappe.log_error(f"Appointment notification failed: {e}", "Orga Appointment")
@@ -990,7 +1124,7 @@ def _notify_rsvp_change(doc, user: str, old_status: str, new_status: str) -> Non
 def _notify_time_proposal(doc, user: str, proposed_start: str, proposed_end: str) -> None:
     """Send notification when user proposes alternative time."""
     try:
-        user_fullname = frappe.db.get_value("User", user, "full_name") or user
+        user_fullname = get_user_fullname(user)
 
         # Notify the appointment owner
         if doc.owner and doc.owner != user:
@@ -1004,7 +1138,8 @@ def _notify_time_proposal(doc, user: str, proposed_start: str, proposed_end: str
                     "proposed_start": proposed_start,
                     "proposed_end": proposed_end
                 },
-                user=doc.owner
+                user=doc.owner,
+                after_commit=True
             )
     except Exception as e:
         frappe.log_error(f"Time proposal notification failed: {e}", "Orga Appointment")
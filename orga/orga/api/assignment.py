@@ -11,6 +11,17 @@ Assignment API endpoints for Orga.
 import json
 import frappe
 from frappe import _
+from orga.orga.utils.doctypes import get_doc_or_throw
+from orga.orga.utils.payload import parse_json_arg
+from orga.orga.utils.queries import get_page_with_total, get_values_by_name
+from orga.orga.utils.users import get_initials
+
+
+# Fields clients may set through update_assignment
+_ALLOWED_ASSIGNMENT_FIELDS = frozenset({
+    "status", "role", "start_date", "end_date",
+    "allocated_hours", "notes"
+})
 
 
 @frappe.whitelist()
@@ -39,7 +50,8 @@ def get_assignments(task=None, resource=None, project=None, status=None, limit=1
     if status:
         filters["status"] = status
 
-    assignments = frappe.get_all(
+    # Filter shapes are covered by patches/v0_16/add_assignment_and_rule_indexes
+    assignments, total = get_page_with_total(
         "Orga Assignment",
         filters=filters,
         fields=[
@@ -47,24 +59,27 @@ def get_assignments(task=None, resource=None, project=None, status=None, limit=1
             "start_date", "end_date", "allocated_hours", "actual_hours"
         ],
         order_by="start_date desc",
-        limit_page_length=int(limit),
-        limit_start=int(offset)
+        limit=limit,
+        offset=offset
     )
 
-    total = frappe.db.count("Orga Assignment", filters)
+    # Enrich with names (one query per linked doctype)
+    tasks = get_values_by_name("Orga Task", [a["task"] for a in assignments], ["subject"])
+    resources = get_values_by_name(
+        "Orga Resource", [a["resource"] for a in assignments], ["resource_name"]
+    )
+    projects = get_values_by_name(
+        "Orga Project", [a["project"] for a in assignments], ["project_name"]
+    )
 
-    # Enrich with names
     for assignment in assignments:
-        assignment["task_subject"] = frappe.db.get_value(
-            "Orga Task", assignment["task"], "subject"
-        )
-        assignment["resource_name"] = frappe.db.get_value(
-            "Orga Resource", assignment["resource"], "resource_name"
-        )
+        task = tasks.get(assignment["task"])
+        resource = resources.get(assignment["resource"])
+        assignment["task_subject"] = task.subject if task else None
+        assignment["resource_name"] = resource.resource_name if resource else None
         if assignment["project"]:
-            assignment["project_name"] = frappe.db.get_value(
-                "Orga Project", assignment["project"], "project_name"
-            )
+            project = projects.get(assignment["project"])
+            assignment["project_name"] = project.project_name if project else None
 
     return {
         "assignments": assignments,
@@ -86,21 +101,18 @@ def get_assignment(name):
     if not name:
         frappe.throw(_("Assignment name is required"))
 
-    if not frappe.db.exists("Orga Assignment", name):
-        frappe.throw(_("Assignment {0} not found").format(name), frappe.DoesNotExistError)
-
-    doc = frappe.get_doc("Orga Assignment", name)
+    doc = get_doc_or_throw("Orga Assignment", name, _("Assignment {0} not found").format(name))
     assignment = doc.as_dict()
 
     # Enrich
-    assignment["task_subject"] = frappe.db.get_value(
+    assignment["task_subject"] = frappe.get_cached_value(
         "Orga Task", assignment["task"], "subject"
     )
-    assignment["resource_name"] = frappe.db.get_value(
+    assignment["resource_name"] = frappe.get_cached_value(
         "Orga Resource", assignment["resource"], "resource_name"
     )
     if assignment["project"]:
-        assignment["project_name"] = frappe.db.get_value(
+        assignment["project_name"] = frappe.get_cached_value(
             "Orga Project", assignment["project"], "project_name"
         )
 
@@ -112,6 +124,8 @@ def create_assignment(task, resource, allocated_hours=None, start_date=None, end
     """
     Create a task assignment.
 
+    Frappe commits the transaction at the end of the request.
+
     Args:
         task: Task name/ID
         resource: Resource name/ID
@@ -143,7 +157,6 @@ def create_assignment(task, resource, allocated_hours=None, start_date=None, end
         "status": "Assigned"
     })
     doc.insert()
-    frappe.db.commit()
 
     return get_assignment(doc.name)
 
@@ -153,6 +166,8 @@ def update_assignment(name, data):
     """
     Update an assignment.
 
+    Frappe commits the transaction at the end of the request.
+
     Args:
         name: Assignment name/ID
         data: dict or JSON string with fields to update
@@ -163,25 +178,15 @@ def update_assignment(name, data):
     if not name:
         frappe.throw(_("Assignment name is required"))
 
-    if isinstance(data, str):
-        data = json.loads(data)
-
-    if not frappe.db.exists("Orga Assignment", name):
-        frappe.throw(_("Assignment {0} not found").format(name), frappe.DoesNotExistError)
+    data = parse_json_arg(data)
 
-    doc = frappe.get_doc("Orga Assignment", name)
-
-    allowed_fields = [
-        "status", "role", "start_date", "end_date",
-        "allocated_hours", "notes"
-    ]
+    doc = get_doc_or_throw("Orga Assignment", name, _("Assignment {0} not found").format(name))
 
     for field, value in data.items():
-        if field in allowed_fields:
-            setattr(doc, field, value)
+        if field in _ALLOWED_ASSIGNMENT_FIELDS:
+            doc.set(field, value)
 
     doc.save()
-    frappe.db.commit()
 
     return get_assignment(doc.name)
 
@@ -191,6 +196,8 @@ def delete_assignment(name):
     """
     Delete an assignment.
 
+    Frappe commits the transaction at the end of the request.
+
     Args:
         name: Assignment name/ID
 
@@ -200,11 +207,8 @@ def delete_assignment(name):
     if not name:
         frappe.throw(_("Assignment name is required"))
 
-    if not frappe.db.exists("Orga Assignment", name):
-        frappe.throw(_("Assignment {0} not found").format(name), frappe.DoesNotExistError)
-
-    frappe.delete_doc("Orga Assignment", name)
-    frappe.db.commit()
+    doc = get_doc_or_throw("Orga Assignment", name, _("Assignment {0} not found").format(name))
+    frappe.delete_doc("Orga Assignment", doc.name)
 
     return {"success": True}
 
@@ -233,23 +237,25 @@ def get_task_assignments(task_name):
         order_by="creation asc"
     )
 
+    resources = get_values_by_name(
+        "Orga Resource",
+        [a["resource"] for a in assignments],
+        ["resource_name", "email", "status"]
+    )
+
     for assignment in assignments:
-        if not assignment.get("resource"):
+        resource = resources.get(assignment.get("resource"))
+        if not resource:
             assignment["resource_name"] = None
             assignment["resource_email"] = None
             assignment["resource_status"] = None
             assignment["initials"] = ""
             continue
-        resource = frappe.get_doc("Orga Resource", assignment["resource"])
         assignment["resource_name"] = resource.resource_name
         assignment["resource_email"] = resource.email
         assignment["resource_status"] = resource.status
-
-        name_parts = resource.resource_name.split()
-        if len(name_parts) >= 2:
-            assignment["initials"] = (name_parts[0][0] + name_parts[-1][0]).upper()
-        else:
-            assignment["initials"] = resource.resource_name[:2].upper()
+        # Memoized, so resources repeated across assignments are split once
+        assignment["initials"] = get_initials(resource.resource_name)
 
     return assignments
 
@@ -287,22 +293,25 @@ def get_resource_assignments(resource_name, status=None, include_completed=False
         order_by="start_date asc"
     )
 
+    tasks = get_values_by_name(
+        "Orga Task",
+        [a["task"] for a in assignments],
+        ["subject", "status", "priority", "due_date"]
+    )
+    projects = get_values_by_name(
+        "Orga Project", [a["project"] for a in assignments], ["project_name"]
+    )
+
     for assignment in assignments:
-        task = frappe.db.get_value(
-            "Orga Task",
-            assignment["task"],
-            ["subject", "status", "priority", "due_date"],
-            as_dict=True
-        )
+        task = tasks.get(assignment["task"])
         assignment["task_subject"] = task.subject if task else None
         assignment["task_status"] = task.status if task else None
         assignment["task_priority"] = task.priority if task else None
         assignment["task_due_date"] = task.due_date if task else None
 
         if assignment["project"]:
-            assignment["project_name"] = frappe.db.get_value(
-                "Orga Project", assignment["project"], "project_name"
-            )
+            project = projects.get(assignment["project"])
+            assignment["project_name"] = project.project_name if project else None
 
     return assignments
 
@@ -589,7 +598,7 @@ def _email_external_assignee(task_doc, contact_name: str) -> None:
 
     project_name = ""
     if task_doc.project:
-        project_name = frappe.db.get_value(
+        project_name = frappe.get_cached_value(
             "Orga Project", task_doc.project, "project_name"
         ) or task_doc.project
 
@@ -13,12 +13,18 @@ Usage from frontend:
     })
 """
 
-import json
 import frappe
 from frappe import _
+from orga.orga.utils.doctypes import get_doc_or_throw
+from orga.orga.utils.payload import parse_json_arg
+from orga.orga.utils.queries import get_page_with_total
 
 
 _ALLOWED_ROLES = ("System Manager", "Orga Manager")
+_FIELD_OPTION_DOCTYPES = ("Orga Task", "Orga Project", "Orga Assignment")
+
+FIELD_OPTIONS_CACHE_KEY = "orga_automation_field_options"
+FIELD_OPTIONS_CACHE_TTL = 600  # seconds, bounds staleness from custom fields (they leave meta.modified as is)
 
 
 def _check_automation_permission():
@@ -28,6 +34,15 @@ def _check_automation_permission():
         frappe.throw(_("Not permitted to manage automation rules"), frappe.PermissionError)
 
 
+def _get_rule_doc(name):
+    """Load an automation rule, throwing a translated error if it is missing."""
+    return get_doc_or_throw(
+        "Orga Automation Rule", name,
+        _("Automation rule {0} not found").format(name),
+        frappe.ValidationError
+    )
+
+
 @frappe.whitelist()
 def get_rules(applies_to=None, is_active=None, limit=50, offset=0):
     """
@@ -48,7 +63,8 @@ def get_rules(applies_to=None, is_active=None, limit=50, offset=0):
     if is_active is not None:
         filters["is_active"] = int(is_active)
 
-    rules = frappe.get_all(
+    # Filter shape is covered by patches/v0_16/add_assignment_and_rule_indexes
+    rules, total = get_page_with_total(
         "Orga Automation Rule",
         filters=filters,
         fields=[
@@ -56,22 +72,17 @@ def get_rules(applies_to=None, is_active=None, limit=50, offset=0):
             "trigger_event", "is_active", "last_run", "run_count", "modified"
         ],
         order_by="modified desc",
-        limit_page_length=int(limit),
-        limit_start=int(offset)
+        limit=limit,
+        offset=offset
     )
 
-    # Add condition and action counts
+    # Add condition and action counts (one grouped query per child table)
+    rule_names = [rule.name for rule in rules]
+    condition_counts = _count_child_rows("Orga Rule Condition", rule_names)
+    action_counts = _count_child_rows("Orga Rule Action", rule_names)
     for rule in rules:
-        rule["condition_count"] = frappe.db.count(
-            "Orga Rule Condition",
-            {"parent": rule.name}
-        )
-        rule["action_count"] = frappe.db.count(
-            "Orga Rule Action",
-            {"parent": rule.name}
-        )
-
-    total = frappe.db.count("Orga Automation Rule", filters)
+        rule["condition_count"] = condition_counts.get(rule.name, 0)
+        rule["action_count"] = action_counts.get(rule.name, 0)
 
     return {
         "rules": rules,
@@ -79,6 +90,18 @@ def get_rules(applies_to=None, is_active=None, limit=50, offset=0):
     }
 
 
+def _count_child_rows(child_doctype, rule_names) -> dict:
+    """Map rule names to their number of rows in a child table with a single query."""
+    if not rule_names:
+        return {}
+    return dict(frappe.db.sql(f"""
+        SELECT parent, COUNT(*)
+        FROM `tab{child_doctype}`
+        WHERE parent IN %s AND parenttype = 'Orga Automation Rule'
+        GROUP BY parent
+    """, (tuple(rule_names),)))
+
+
 @frappe.whitelist()
 def get_rule(name):
     """
@@ -90,10 +113,7 @@ def get_rule(name):
     Returns:
         dict: Full rule document
     """
-    if not frappe.db.exists("Orga Automation Rule", name):
-        frappe.throw(_("Automation rule {0} not found").format(name))
-
-    rule = frappe.get_doc("Orga Automation Rule", name)
+    rule = _get_rule_doc(name)
     return rule.as_dict()
 
 
@@ -115,10 +135,8 @@ def create_rule(rule_name, applies_to, trigger_event, actions, conditions=None,
     """
     _check_automation_permission()
 
-    if isinstance(actions, str):
-        actions = json.loads(actions)
-    if isinstance(conditions, str):
-        conditions = json.loads(conditions) if conditions else []
+    actions = parse_json_arg(actions)
+    conditions = parse_json_arg(conditions) if conditions else []
 
     rule = frappe.get_doc({
         "doctype": "Orga Automation Rule",
@@ -148,29 +166,19 @@ def update_rule(name, data):
     """
     _check_automation_permission()
 
-    if not frappe.db.exists("Orga Automation Rule", name):
-        frappe.throw(_("Automation rule {0} not found").format(name))
-
-    if isinstance(data, str):
-        data = json.loads(data)
+    data = parse_json_arg(data)
 
-    rule = frappe.get_doc("Orga Automation Rule", name)
+    rule = _get_rule_doc(name)
 
     # Update simple fields
     for field in ["rule_name", "description", "applies_to", "trigger_event", "is_active", "schedule_type"]:
         if field in data:
             rule.set(field, data[field])
 
-    # Update child tables if provided
-    if "conditions" in data:
-        rule.conditions = []
-        for cond in data["conditions"]:
-            rule.append("conditions", cond)
-
-    if "actions" in data:
-        rule.actions = []
-        for action in data["actions"]:
-            rule.append("actions", action)
+    # Replace child tables if provided
+    for table in ("conditions", "actions"):
+        if table in data:
+            rule.set(table, data[table])
 
     rule.save()
 
@@ -190,10 +198,8 @@ def delete_rule(name):
     """
     _check_automation_permission()
 
-    if not frappe.db.exists("Orga Automation Rule", name):
-        frappe.throw(_("Automation rule {0} not found").format(name))
-
-    frappe.delete_doc("Orga Automation Rule", name)
+    rule = _get_rule_doc(name)
+    frappe.delete_doc("Orga Automation Rule", rule.name)
 
     return {"success": True}
 
@@ -211,14 +217,7 @@ def activate_rule(name):
     """
     _check_automation_permission()
 
-    if not frappe.db.exists("Orga Automation Rule", name):
-        frappe.throw(_("Automation rule {0} not found").format(name))
-
-    rule = frappe.get_doc("Orga Automation Rule", name)
-    rule.is_active = 1
-    rule.save()
-
-    return rule.as_dict()
+    return _set_rule_active(name, 1)
 
 
 @frappe.whitelist()
@@ -234,12 +233,15 @@ def deactivate_rule(name):
     """
     _check_automation_permission()
 
-    if not frappe.db.exists("Orga Automation Rule", name):
-        frappe.throw(_("Automation rule {0} not found").format(name))
+    return _set_rule_active(name, 0)
 
-    rule = frappe.get_doc("Orga Automation Rule", name)
-    rule.is_active = 0
-    rule.save()
+
+def _set_rule_active(name, is_active):
+    """Set is_active through save() so validation and version tracking run; skips no-op saves."""
+    rule = _get_rule_doc(name)
+    if rule.is_active != is_active:
+        rule.is_active = is_active
+        rule.save()
 
     return rule.as_dict()
 
@@ -272,11 +274,17 @@ def get_field_options(doctype):
     Returns:
         list: Field options with name and label
     """
-    if doctype not in ("Orga Task", "Orga Project", "Orga Assignment"):
+    if doctype not in _FIELD_OPTION_DOCTYPES:
         frappe.throw(_("Invalid DocType"))
 
     meta = frappe.get_meta(doctype)
 
+    # meta.modified in the key drops the entry when the DocType changes
+    cache_key = f"{FIELD_OPTIONS_CACHE_KEY}:{doctype}:{meta.modified}"
+    cached = frappe.cache.get_value(cache_key)
+    if cached:
+        return cached
+
     fields = []
     for field in meta.fields:
         if field.fieldtype not in ("Section Break", "Column Break", "Tab Break", "HTML"):
@@ -287,4 +295,5 @@ def get_field_options(doctype):
                 "options": field.options
             })
 
+    frappe.cache.set_value(cache_key, fields, expires_in_sec=FIELD_OPTIONS_CACHE_TTL)
     return fields
@@ -16,6 +16,11 @@ Usage from frontend:
 import frappe
 from frappe import _
 from frappe.utils import getdate, nowdate, add_days, get_first_day, get_last_day
+from orga.orga.utils.queries import get_task_counts_by_project, get_values_by_name
+
+# Site-wide counts polled by every dashboard; cleared on task/project/milestone changes
+STATS_CACHE_KEY = "orga_dashboard_stats"
+STATS_CACHE_TTL = 60  # seconds, bounds staleness from direct db writes and date rollover
 
 
 @frappe.whitelist()
@@ -26,84 +31,80 @@ def get_stats():
     Returns:
         dict: Dashboard stats for projects, tasks, and milestones
     """
+    cached = frappe.cache.get_value(STATS_CACHE_KEY)
+    if cached:
+        return cached
+
     today = getdate(nowdate())
     week_ago = add_days(today, -7)
     week_ahead = add_days(today, 7)
 
     # Project counts
-    total_projects = frappe.db.count("Orga Project")
+    project_counts = _count_by_status("Orga Project")
+    total_projects = sum(project_counts.values())
     projects_by_status = {
-        "planning": frappe.db.count("Orga Project", {"status": "Planning"}),
-        "active": frappe.db.count("Orga Project", {"status": "Active"}),
-        "on_hold": frappe.db.count("Orga Project", {"status": "On Hold"}),
-        "completed": frappe.db.count("Orga Project", {"status": "Completed"}),
-        "cancelled": frappe.db.count("Orga Project", {"status": "Cancelled"}),
+        "planning": project_counts.get("Planning", 0),
+        "active": project_counts.get("Active", 0),
+        "on_hold": project_counts.get("On Hold", 0),
+        "completed": project_counts.get("Completed", 0),
+        "cancelled": project_counts.get("Cancelled", 0),
     }
 
-    # Task counts
-    total_tasks = frappe.db.count("Orga Task")
+    # Task counts, priorities and due-date windows in one pass over the table
+    task_stats = frappe.db.sql("""
+        SELECT
+            COUNT(*) as total,
+            COALESCE(SUM(CASE WHEN status = 'Open' THEN 1 ELSE 0 END), 0) as open,
+            COALESCE(SUM(CASE WHEN status = 'In Progress' THEN 1 ELSE 0 END), 0) as in_progress,
+            COALESCE(SUM(CASE WHEN status = 'Review' THEN 1 ELSE 0 END), 0) as review,
+            COALESCE(SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END), 0) as completed,
+            COALESCE(SUM(CASE WHEN status = 'Cancelled' THEN 1 ELSE 0 END), 0) as cancelled,
+            COALESCE(SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND priority = 'Urgent' THEN 1 ELSE 0 END), 0) as urgent,
+            COALESCE(SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND priority = 'High' THEN 1 ELSE 0 END), 0) as high,
+            COALESCE(SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND priority = 'Medium' THEN 1 ELSE 0 END), 0) as medium,
+            COALESCE(SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND priority = 'Low' THEN 1 ELSE 0 END), 0) as low,
+            COALESCE(SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND due_date < %(today)s THEN 1 ELSE 0 END), 0) as overdue,
+            COALESCE(SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND due_date BETWEEN %(today)s AND %(week_ahead)s THEN 1 ELSE 0 END), 0) as due_this_week,
+            COALESCE(SUM(CASE WHEN status = 'Completed'
+                AND completed_date >= %(week_ago)s THEN 1 ELSE 0 END), 0) as completed_this_week
+        FROM `tabOrga Task`
+    """, {"today": today, "week_ago": week_ago, "week_ahead": week_ahead}, as_dict=True)[0]
+
+    total_tasks = task_stats.total
     tasks_by_status = {
-        "open": frappe.db.count("Orga Task", {"status": "Open"}),
-        "in_progress": frappe.db.count("Orga Task", {"status": "In Progress"}),
-        "review": frappe.db.count("Orga Task", {"status": "Review"}),
-        "completed": frappe.db.count("Orga Task", {"status": "Completed"}),
-        "cancelled": frappe.db.count("Orga Task", {"status": "Cancelled"}),
+        "open": int(task_stats.open),
+        "in_progress": int(task_stats.in_progress),
+        "review": int(task_stats.review),
+        "completed": int(task_stats.completed),
+        "cancelled": int(task_stats.cancelled),
     }
 
     # Tasks by priority
     tasks_by_priority = {
-        "urgent": frappe.db.count("Orga Task", {
-            "priority": "Urgent",
-            "status": ["not in", ["Completed", "Cancelled"]]
-        }),
-        "high": frappe.db.count("Orga Task", {
-            "priority": "High",
-            "status": ["not in", ["Completed", "Cancelled"]]
-        }),
-        "medium": frappe.db.count("Orga Task", {
-            "priority": "Medium",
-            "status": ["not in", ["Completed", "Cancelled"]]
-        }),
-        "low": frappe.db.count("Orga Task", {
-            "priority": "Low",
-            "status": ["not in", ["Completed", "Cancelled"]]
-        }),
+        "urgent": int(task_stats.urgent),
+        "high": int(task_stats.high),
+        "medium": int(task_stats.medium),
+        "low": int(task_stats.low),
     }
 
-    # Overdue tasks
-    overdue_tasks = frappe.db.count(
-        "Orga Task",
-        {
-            "status": ["not in", ["Completed", "Cancelled"]],
-            "due_date": ["<", today]
-        }
-    )
-
-    # Tasks due this week
-    tasks_due_week = frappe.db.count(
-        "Orga Task",
-        {
-            "status": ["not in", ["Completed", "Cancelled"]],
-            "due_date": ["between", [today, week_ahead]]
-        }
-    )
-
-    # Completed this week
-    completed_this_week = frappe.db.count(
-        "Orga Task",
-        {
-            "status": "Completed",
-            "completed_date": [">=", week_ago]
-        }
-    )
+    overdue_tasks = int(task_stats.overdue)
+    tasks_due_week = int(task_stats.due_this_week)
+    completed_this_week = int(task_stats.completed_this_week)
 
     # Milestones
-    total_milestones = frappe.db.count("Orga Milestone")
+    milestone_counts = _count_by_status("Orga Milestone")
+    total_milestones = sum(milestone_counts.values())
     milestones_by_status = {
-        "upcoming": frappe.db.count("Orga Milestone", {"status": "Upcoming"}),
-        "in_progress": frappe.db.count("Orga Milestone", {"status": "In Progress"}),
-        "completed": frappe.db.count("Orga Milestone", {"status": "Completed"}),
-        "missed": frappe.db.count("Orga Milestone", {"status": "Missed"}),
+        "upcoming": milestone_counts.get("Upcoming", 0),
+        "in_progress": milestone_counts.get("In Progress", 0),
+        "completed": milestone_counts.get("Completed", 0),
+        "missed": milestone_counts.get("Missed", 0),
     }
 
     # Upcoming milestones (next 14 days)
@@ -115,7 +116,7 @@ def get_stats():
         }
     )
 
-    return {
+    stats = {
         "projects": {
             "total": total_projects,
             "by_status": projects_by_status
@@ -135,6 +136,14 @@ def get_stats():
         }
     }
 
+    frappe.cache.set_value(STATS_CACHE_KEY, stats, expires_in_sec=STATS_CACHE_TTL)
+    return stats
+
+
+def clear_stats_cache(doc=None, method=None):
+    """Doc event hook: drop cached dashboard stats after a counted record changes."""
+    frappe.cache.delete_value(STATS_CACHE_KEY)
+
 
 @frappe.whitelist()
 def get_recent_activity(limit=20):
@@ -158,12 +167,6 @@ def get_recent_activity(limit=20):
     )
 
     for task in tasks:
-        project_name = None
-        if task.project:
-            project_name = frappe.db.get_value("Orga Project", task.project, "project_name")
-
-        user_info = frappe.db.get_value("User", task.modified_by, ["full_name", "user_image"], as_dict=True) or {}
-
         activity.append({
             "type": "task",
             "action": "updated",
@@ -171,11 +174,9 @@ def get_recent_activity(limit=20):
             "title": task.subject,
             "status": task.status,
             "project": task.project,
-            "project_name": project_name,
+            "project_name": None,
             "timestamp": task.modified,
             "user": task.modified_by,
-            "user_name": user_info.get("full_name"),
-            "user_image": user_info.get("user_image"),
             "reference_doctype": "Orga Task",
             "reference_name": task.name,
         })
@@ -189,12 +190,6 @@ def get_recent_activity(limit=20):
     )
 
     for ms in milestones:
-        project_name = None
-        if ms.project:
-            project_name = frappe.db.get_value("Orga Project", ms.project, "project_name")
-
-        user_info = frappe.db.get_value("User", ms.modified_by, ["full_name", "user_image"], as_dict=True) or {}
-
         activity.append({
             "type": "milestone",
             "action": "updated",
@@ -202,11 +197,9 @@ def get_recent_activity(limit=20):
             "title": ms.milestone_name,
             "status": ms.status,
             "project": ms.project,
-            "project_name": project_name,
+            "project_name": None,
             "timestamp": ms.modified,
             "user": ms.modified_by,
-            "user_name": user_info.get("full_name"),
-            "user_image": user_info.get("user_image"),
             "reference_doctype": "Orga Milestone",
             "reference_name": ms.name,
         })
@@ -220,12 +213,6 @@ def get_recent_activity(limit=20):
     )
 
     for appt in appointments:
-        project_name = None
-        if appt.project:
-            project_name = frappe.db.get_value("Orga Project", appt.project, "project_name")
-
-        user_info = frappe.db.get_value("User", appt.modified_by, ["full_name", "user_image"], as_dict=True) or {}
-
         # Determine action based on timing
         action = "updated"
         if appt.creation and appt.modified:
@@ -245,11 +232,9 @@ def get_recent_activity(limit=20):
             "title": appt.title,
             "status": appt.status or appt.event_type,
             "project": appt.project,
-            "project_name": project_name,
+            "project_name": None,
             "timestamp": appt.modified,
             "user": appt.modified_by,
-            "user_name": user_info.get("full_name"),
-            "user_image": user_info.get("user_image"),
             "reference_doctype": "Orga Appointment",
             "reference_name": appt.name,
             "event_type": appt.event_type,
@@ -265,7 +250,23 @@ def get_recent_activity(limit=20):
 
     # Sort by timestamp and limit
     activity.sort(key=lambda x: x["timestamp"], reverse=True)
-    return activity[:int(limit)]
+    activity = activity[:int(limit)]
+
+    # Batch user-info and project-name loading (one query each)
+    user_info_map = get_values_by_name(
+        "User", [a.get("user") for a in activity], ["full_name", "user_image"]
+    )
+    project_names = get_values_by_name(
+        "Orga Project", [a.get("project") for a in activity], "project_name"
+    )
+
+    for item in activity:
+        ui = user_info_map.get(item.get("user"), {})
+        item["user_name"] = ui.get("full_name")
+        item["user_image"] = ui.get("user_image")
+        item["project_name"] = project_names.get(item.get("project"))
+
+    return activity
 
 
 @frappe.whitelist()
@@ -372,27 +373,13 @@ def get_activity_since(since_timestamp: str, limit: int = 20) -> dict:
     if not items:
         return {"items": [], "count": 0, "latest_timestamp": since_timestamp}
 
-    # --- Batch user-info loading (single query for all unique users) ---
-    unique_users = list({i["user"] for i in items if i.get("user")})
-    user_info_map: dict = {}
-    if unique_users:
-        user_rows = frappe.get_all(
-            "User",
-            filters={"name": ["in", unique_users]},
-            fields=["name", "full_name", "user_image"],
-        )
-        user_info_map = {u["name"]: u for u in user_rows}
-
-    # --- Batch project-name loading ---
-    unique_projects = list({i["project"] for i in items if i.get("project")})
-    project_name_map: dict = {}
-    if unique_projects:
-        project_rows = frappe.get_all(
-            "Orga Project",
-            filters={"name": ["in", unique_projects]},
-            fields=["name", "project_name"],
-        )
-        project_name_map = {p["name"]: p["project_name"] for p in project_rows}
+    # --- Batch user-info and project-name loading (one query each) ---
+    user_info_map = get_values_by_name(
+        "User", [i.get("user") for i in items], ["full_name", "user_image"]
+    )
+    project_name_map = get_values_by_name(
+        "Orga Project", [i.get("project") for i in items], "project_name"
+    )
 
     # Enrich items
     for item in items:
@@ -446,12 +433,14 @@ def get_my_tasks(status=None, limit=10):
         limit_page_length=int(limit)
     )
 
+    project_names = get_values_by_name(
+        "Orga Project", [t.get("project") for t in tasks], "project_name"
+    )
+
     # Enrich with project names
     for task in tasks:
         if task.get("project"):
-            task["project_name"] = frappe.db.get_value(
-                "Orga Project", task["project"], "project_name"
-            )
+            task["project_name"] = project_names.get(task["project"])
 
         # Check if overdue
         if task.get("due_date"):
@@ -489,16 +478,17 @@ def get_overdue_tasks(limit=20):
         limit_page_length=int(limit)
     )
 
+    project_names = get_values_by_name(
+        "Orga Project", [t.get("project") for t in tasks], "project_name"
+    )
+    user_names = get_values_by_name("User", [t.get("assigned_to") for t in tasks], "full_name")
+
     # Enrich with names and days overdue
     for task in tasks:
         if task.get("project"):
-            task["project_name"] = frappe.db.get_value(
-                "Orga Project", task["project"], "project_name"
-            )
+            task["project_name"] = project_names.get(task["project"])
         if task.get("assigned_to"):
-            task["assigned_to_name"] = frappe.db.get_value(
-                "User", task["assigned_to"], "full_name"
-            )
+            task["assigned_to_name"] = user_names.get(task["assigned_to"])
 
         # Calculate days overdue
         task["days_overdue"] = (today - getdate(task["due_date"])).days
@@ -535,12 +525,14 @@ def get_upcoming_milestones(days=14, limit=10):
         limit_page_length=int(limit)
     )
 
+    project_names = get_values_by_name(
+        "Orga Project", [ms.get("project") for ms in milestones], "project_name"
+    )
+
     # Enrich with project names and days until due
     for ms in milestones:
         if ms.get("project"):
-            ms["project_name"] = frappe.db.get_value(
-                "Orga Project", ms["project"], "project_name"
-            )
+            ms["project_name"] = project_names.get(ms["project"])
 
         # Calculate days until due
         ms["days_until_due"] = (getdate(ms["due_date"]) - today).days
@@ -568,29 +560,21 @@ def get_project_summary():
     )
 
     today = getdate(nowdate())
+    manager_names = get_values_by_name(
+        "User", [p.get("project_manager") for p in projects], "full_name"
+    )
+    task_counts = get_task_counts_by_project([p["name"] for p in projects])
 
     for project in projects:
         # Get task counts
-        project["task_count"] = frappe.db.count(
-            "Orga Task", {"project": project["name"]}
-        )
-        project["completed_tasks"] = frappe.db.count(
-            "Orga Task", {"project": project["name"], "status": "Completed"}
-        )
-        project["overdue_tasks"] = frappe.db.count(
-            "Orga Task",
-            {
-                "project": project["name"],
-                "status": ["not in", ["Completed", "Cancelled"]],
-                "due_date": ["<", today]
-            }
-        )
+        counts = task_counts.get(project["name"], {})
+        project["task_count"] = counts.get("total", 0)
+        project["completed_tasks"] = counts.get("completed", 0)
+        project["overdue_tasks"] = counts.get("overdue", 0)
 
         # Get manager name
         if project.get("project_manager"):
-            project["project_manager_name"] = frappe.db.get_value(
-                "User", project["project_manager"], "full_name"
-            )
+            project["project_manager_name"] = manager_names.get(project["project_manager"])
 
         # Calculate days remaining
         if project.get("end_date"):
@@ -615,21 +599,21 @@ def get_workload_by_user(project=None):
     Returns:
         list: Users with task counts
     """
-    filters = {"status": ["not in", ["Completed", "Cancelled"]]}
-    if project:
-        filters["project"] = project
+    project_condition = "AND project = %(project)s" if project else ""
 
-    # Get all active tasks with assignees
-    tasks = frappe.get_all(
-        "Orga Task",
-        filters=filters,
-        fields=["assigned_to", "priority"]
-    )
+    # Count active tasks per assignee and priority in the database
+    counts = frappe.db.sql(f"""
+        SELECT assigned_to, priority, COUNT(*) as count
+        FROM `tabOrga Task`
+        WHERE status NOT IN ('Completed', 'Cancelled')
+            {project_condition}
+        GROUP BY assigned_to, priority
+    """, {"project": project}, as_dict=True)
 
     # Group by user
     workload = {}
-    for task in tasks:
-        user = task.get("assigned_to")
+    for row in counts:
+        user = row.get("assigned_to")
         if not user:
             user = "Unassigned"
 
@@ -643,18 +627,17 @@ def get_workload_by_user(project=None):
                 "low": 0
             }
 
-        workload[user]["total"] += 1
-        priority = task.get("priority", "Medium").lower()
+        workload[user]["total"] += row["count"]
+        priority = (row.get("priority") or "Medium").lower()
         if priority in workload[user]:
-            workload[user][priority] += 1
+            workload[user][priority] += row["count"]
 
     # Convert to list and add user names
     result = list(workload.values())
+    user_names = get_values_by_name("User", [u for u in workload if u != "Unassigned"], "full_name")
     for item in result:
         if item["user"] != "Unassigned":
-            item["user_name"] = frappe.db.get_value(
-                "User", item["user"], "full_name"
-            )
+            item["user_name"] = user_names.get(item["user"])
         else:
             item["user_name"] = "Unassigned"
 
@@ -758,6 +741,16 @@ def recalculate_project_health(project_name):
     return update_project_health(project_name)
 
 
+def _count_by_status(doctype: str) -> dict:
+    """Count all rows of a doctype per status with a single GROUP BY query."""
+    rows = frappe.db.sql(f"""
+        SELECT status, COUNT(*) as count
+        FROM `tab{doctype}`
+        GROUP BY status
+    """, as_dict=True)
+    return {row.status: row.count for row in rows}
+
+
 def _get_appointment_rsvp_info(appointment_name: str) -> dict:
     """
     Get RSVP info for an appointment (for activity card display).
@@ -769,7 +762,22 @@ def _get_appointment_rsvp_info(appointment_name: str) -> dict:
         dict: {is_attendee, user_rsvp_status, attendee_stats, attendees}
     """
     try:
-        doc = frappe.get_doc("Orga Appointment", appointment_name)
+        session_user = frappe.session.user
+
+        # Attendees with their User / Resource display info in one query
+        rows = frappe.db.sql("""
+            SELECT
+                att.user, att.resource, att.resource_name, att.rsvp_status,
+                usr.full_name, usr.user_image,
+                res.resource_name as resource_display_name,
+                res.user as resource_user, res_usr.user_image as resource_user_image
+            FROM `tabOrga Appointment Attendee` att
+            LEFT JOIN `tabUser` usr ON usr.name = att.user
+            LEFT JOIN `tabOrga Resource` res ON res.name = att.resource
+            LEFT JOIN `tabUser` res_usr ON res_usr.name = res.user
+            WHERE att.parent = %s AND att.parenttype = 'Orga Appointment'
+            ORDER BY att.idx
+        """, (appointment_name,), as_dict=True)
 
         # Find current user's status
         is_attendee = False
@@ -778,41 +786,31 @@ def _get_appointment_rsvp_info(appointment_name: str) -> dict:
         attendees = []
         stats = {"total": 0, "accepted": 0, "declined": 0, "tentative": 0, "pending": 0}
 
-        for att in doc.attendees:
+        for att in rows:
             stats["total"] += 1
             status_key = (att.rsvp_status or "Pending").lower()
             if status_key in stats:
                 stats[status_key] += 1
 
             # Check if current user is this attendee
-            if att.user == frappe.session.user:
+            if att.user == session_user:
+                is_attendee = True
+                user_rsvp_status = att.rsvp_status
+            elif att.resource and att.resource_user == session_user:
                 is_attendee = True
                 user_rsvp_status = att.rsvp_status
-            elif att.resource:
-                resource_user = frappe.db.get_value("Orga Resource", att.resource, "user")
-                if resource_user == frappe.session.user:
-                    is_attendee = True
-                    user_rsvp_status = att.rsvp_status
 
             # Get attendee display info
             name = att.resource_name
             user_image = None
 
+            # Missing User / Resource rows come back as NULLs from the LEFT JOINs
             if att.user:
-                user_info = frappe.db.get_value(
-                    "User", att.user, ["full_name", "user_image"], as_dict=True
-                )
-                if user_info:
-                    name = user_info.get("full_name") or name
-                    user_image = user_info.get("user_image")
+                name = att.full_name or name
+                user_image = att.user_image
             elif att.resource:
-                resource_info = frappe.db.get_value(
-                    "Orga Resource", att.resource, ["resource_name", "user"], as_dict=True
-                )
-                if resource_info:
-                    name = resource_info.get("resource_name") or name
-                    if resource_info.get("user"):
-                        user_image = frappe.db.get_value("User", resource_info["user"], "user_image")
+                name = att.resource_display_name or name
+                user_image = att.resource_user_image
 
             attendees.append({
                 "name": name,
@@ -17,6 +17,7 @@ Usage from frontend:
 import json
 import frappe
 from frappe import _
+from orga.orga.utils.doctypes import get_doc_or_throw
 
 
 @frappe.whitelist()
@@ -216,10 +217,9 @@ def delete_defect(name):
     if not name:
         frappe.throw(_("Defect name is required"))
 
-    if not frappe.db.exists("Orga Defect", name):
-        frappe.throw(_("Defect {0} not found").format(name), frappe.DoesNotExistError)
+    defect = get_doc_or_throw("Orga Defect", name, _("Defect {0} not found").format(name))
 
-    if not frappe.has_permission("Orga Defect", "delete", name):
+    if not frappe.has_permission("Orga Defect", "delete", defect):
         frappe.throw(_("Not permitted to delete this defect"), frappe.PermissionError)
 
     frappe.delete_doc("Orga Defect", name)
@@ -67,13 +67,12 @@ def get_milestones(project, status=None, limit=50, offset=0):
 
     total = frappe.db.count("Orga Milestone", filters)
 
-    # Calculate completion percentage for each milestone
+    # Calculate completion percentage for each milestone (one aggregate for the page)
+    task_stats = _get_milestone_task_stats([m["name"] for m in milestones])
     for milestone in milestones:
-        milestone["completion_percentage"] = _calculate_milestone_completion(milestone["name"])
-        milestone["task_count"] = frappe.db.count(
-            "Orga Task",
-            {"milestone": milestone["name"]}
-        )
+        task_total, completed = task_stats.get(milestone["name"], (0, 0))
+        milestone["completion_percentage"] = round((completed / task_total) * 100) if task_total else 0
+        milestone["task_count"] = task_total
 
     return {"milestones": milestones, "total": total}
 
@@ -326,16 +325,27 @@ def reorder_milestones(project, milestone_id, new_index):
         frappe.throw(_("Failed to reorder milestones: {0}").format(str(e)))
 
 
+def _get_milestone_task_stats(milestone_names):
+    """Get {milestone: (task_count, completed_count)} with one GROUP BY query."""
+    if not milestone_names:
+        return {}
+
+    rows = frappe.db.sql("""
+        SELECT milestone, COUNT(*) as total,
+            SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END) as completed
+        FROM `tabOrga Task`
+        WHERE milestone IN %s
+        GROUP BY milestone
+    """, (tuple(milestone_names),), as_dict=True)
+
+    return {row.milestone: (row.total, int(row.completed or 0)) for row in rows}
+
+
 def _calculate_milestone_completion(milestone_name):
     """Calculate completion percentage based on linked tasks."""
-    tasks = frappe.get_all(
-        "Orga Task",
-        filters={"milestone": milestone_name},
-        fields=["status"]
-    )
+    total, completed = _get_milestone_task_stats([milestone_name]).get(milestone_name, (0, 0))
 
-    if not tasks:
+    if not total:
         return 0
 
-    completed = sum(1 for t in tasks if t.status == "Completed")
-    return round((completed / len(tasks)) * 100)
+    return round((completed / total) * 100)
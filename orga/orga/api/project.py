@@ -18,6 +18,8 @@ import json
 import frappe
 from frappe import _
 from orga.orga.api.task import _enrich_assigned_to, _enrich_task_resource
+from orga.orga.utils.doctypes import doctype_exists, get_doc_or_throw
+from orga.orga.utils.queries import get_task_counts_by_project
 
 
 def _has_sort_order(doctype: str) -> bool:
@@ -39,7 +41,7 @@ def _has_column(doctype: str, column: str) -> bool:
 def _enrich_task_assignees(tasks: list[dict]) -> None:
     """Add an `assignees` list to each task from Orga Assignment contacts (batch query)."""
     task_names = [t["name"] for t in tasks if t.get("name")]
-    if not task_names or not frappe.db.exists("DocType", "Orga Assignment"):
+    if not task_names or not doctype_exists("Orga Assignment"):
         for t in tasks:
             t["assignees"] = []
         return
@@ -141,18 +143,13 @@ def get_projects(status=None, project_type=None, project_manager=None, limit=20,
 
     total = frappe.db.count("Orga Project", filters)
 
-    # Enrich with task counts
+    # Enrich with task counts (one GROUP BY for the whole page)
+    task_counts = get_task_counts_by_project([p["name"] for p in projects])
     for project in projects:
-        task_filters = {"project": project["name"]}
-        project["task_count"] = frappe.db.count("Orga Task", task_filters)
-        project["completed_tasks"] = frappe.db.count(
-            "Orga Task",
-            {**task_filters, "status": "Completed"}
-        )
-        project["open_tasks"] = frappe.db.count(
-            "Orga Task",
-            {**task_filters, "status": "Open"}
-        )
+        counts = task_counts.get(project["name"], {})
+        project["task_count"] = counts.get("total", 0)
+        project["completed_tasks"] = counts.get("completed", 0)
+        project["open_tasks"] = counts.get("open", 0)
 
         # Get project manager full name
         if project.get("project_manager"):
@@ -179,14 +176,11 @@ def get_project(name):
     if not name:
         frappe.throw(_("Project name is required"))
 
-    if not frappe.db.exists("Orga Project", name):
-        frappe.throw(_("Project {0} not found").format(name), frappe.DoesNotExistError)
+    project = get_doc_or_throw("Orga Project", name, _("Project {0} not found").format(name))
 
-    if not frappe.has_permission("Orga Project", "read", name):
+    if not frappe.has_permission("Orga Project", "read", project):
         frappe.throw(_("Not permitted to access this project"), frappe.PermissionError)
 
-    project = frappe.get_doc("Orga Project", name)
-
     # Get tasks
     task_has_sort = _has_sort_order("Orga Task")
     task_fields = [
@@ -236,8 +230,14 @@ def get_project(name):
     )
 
     # Calculate completion percentage for each milestone from linked tasks
+    # (bucket tasks once instead of rescanning the full task list per milestone)
+    tasks_by_milestone = {}
+    for t in tasks:
+        if t.get("milestone"):
+            tasks_by_milestone.setdefault(t["milestone"], []).append(t)
+
     for milestone in milestones:
-        linked_tasks = [t for t in tasks if t.get("milestone") == milestone["name"]]
+        linked_tasks = tasks_by_milestone.get(milestone["name"], [])
         milestone["task_count"] = len(linked_tasks)
         if linked_tasks:
             completed = sum(1 for t in linked_tasks if t["status"] == "Completed")
@@ -284,7 +284,7 @@ def get_project(name):
             })
 
     # Collect all contacts assigned to project tasks via Orga Assignment
-    if frappe.db.exists("DocType", "Orga Assignment"):
+    if doctype_exists("Orga Assignment"):
         task_names = [t.get("name") for t in tasks if t.get("name")]
         if task_names:
             assignments = frappe.get_all(
@@ -454,10 +454,9 @@ def delete_project(name):
     if not name:
         frappe.throw(_("Project name is required"))
 
-    if not frappe.db.exists("Orga Project", name):
-        frappe.throw(_("Project {0} not found").format(name), frappe.DoesNotExistError)
+    project = get_doc_or_throw("Orga Project", name, _("Project {0} not found").format(name))
 
-    if not frappe.has_permission("Orga Project", "delete", name):
+    if not frappe.has_permission("Orga Project", "delete", project):
         frappe.throw(_("Not permitted to delete this project"), frappe.PermissionError)
 
     # Count and delete associated tasks (use delete_task API for full cleanup)
@@ -478,7 +477,7 @@ def delete_project(name):
     # Note: time tracking moved to Watch app (Watch Entry.orga_project custom field stays as historical ref)
     frappe.db.set_value("Orga Appointment", {"project": name}, "project", "", update_modified=False)
 
-    if frappe.db.exists("DocType", "Orga Defect"):
+    if doctype_exists("Orga Defect"):
         frappe.db.set_value("Orga Defect", {"project": name}, "project", "", update_modified=False)
 
     # Delete project (force=True to handle any remaining links)
@@ -711,38 +710,43 @@ def get_project_stats(name=None):
         if not frappe.db.exists("Orga Project", name):
             frappe.throw(_("Project {0} not found").format(name))
 
-        task_filters = {"project": name}
-        milestone_filters = {"project": name}
-    else:
-        task_filters = {}
-        milestone_filters = {}
-
-    today = frappe.utils.nowdate()
+    project_clause = "WHERE project = %(project)s" if name else ""
+    params = {"project": name, "today": frappe.utils.nowdate()}
+
+    # One GROUP BY per table; overdue rides along as a conditional sum
+    task_rows = frappe.db.sql(f"""
+        SELECT status, COUNT(*) as count,
+            SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND due_date < %(today)s THEN 1 ELSE 0 END) as overdue
+        FROM `tabOrga Task`
+        {project_clause}
+        GROUP BY status
+    """, params, as_dict=True)
+    milestone_rows = frappe.db.sql(f"""
+        SELECT status, COUNT(*) as count
+        FROM `tabOrga Milestone`
+        {project_clause}
+        GROUP BY status
+    """, params, as_dict=True)
+
+    task_counts = {row.status: row.count for row in task_rows}
+    milestone_counts = {row.status: row.count for row in milestone_rows}
 
-    stats = {
+    return {
         "tasks": {
-            "total": frappe.db.count("Orga Task", task_filters),
-            "open": frappe.db.count("Orga Task", {**task_filters, "status": "Open"}),
-            "in_progress": frappe.db.count("Orga Task", {**task_filters, "status": "In Progress"}),
-            "review": frappe.db.count("Orga Task", {**task_filters, "status": "Review"}),
-            "completed": frappe.db.count("Orga Task", {**task_filters, "status": "Completed"}),
-            "cancelled": frappe.db.count("Orga Task", {**task_filters, "status": "Cancelled"}),
+            "total": sum(task_counts.values()),
+            "open": task_counts.get("Open", 0),
+            "in_progress": task_counts.get("In Progress", 0),
+            "review": task_counts.get("Review", 0),
+            "completed": task_counts.get("Completed", 0),
+            "cancelled": task_counts.get("Cancelled", 0),
+            "overdue": int(sum(row.overdue or 0 for row in task_rows)),
         },
         "milestones": {
-            "total": frappe.db.count("Orga Milestone", milestone_filters),
-            "upcoming": frappe.db.count("Orga Milestone", {**milestone_filters, "status": "Upcoming"}),
-            "in_progress": frappe.db.count("Orga Milestone", {**milestone_filters, "status": "In Progress"}),
-            "completed": frappe.db.count("Orga Milestone", {**milestone_filters, "status": "Completed"}),
-            "missed": frappe.db.count("Orga Milestone", {**milestone_filters, "status": "Missed"}),
+            "total": sum(milestone_counts.values()),
+            "upcoming": milestone_counts.get("Upcoming", 0),
+            "in_progress": milestone_counts.get("In Progress", 0),
+            "completed": milestone_counts.get("Completed", 0),
+            "missed": milestone_counts.get("Missed", 0),
         }
     }
-
-    # Calculate overdue tasks
-    overdue_filters = {
-        **task_filters,
-        "status": ["not in", ["Completed", "Cancelled"]],
-        "due_date": ["<", today]
-    }
-    stats["tasks"]["overdue"] = frappe.db.count("Orga Task", overdue_filters)
-
-    return stats
@@ -57,6 +57,20 @@ def get_resources(status=None, department=None, resource_type=None, skill=None,
 
     total = frappe.db.count("Orga Resource", filters)
 
+    # Active assignment count and allocated hours per resource, aggregated in SQL
+    workload = {}
+    if resources:
+        workload = {
+            row.resource: row
+            for row in frappe.db.sql("""
+                SELECT resource, COUNT(*) as count, SUM(allocated_hours) as allocated_hours
+                FROM `tabOrga Assignment`
+                WHERE resource IN %s
+                    AND status IN ('Assigned', 'In Progress')
+                GROUP BY resource
+            """, (tuple(r["name"] for r in resources),), as_dict=True)
+        }
+
     for resource in resources:
         # Resolve identity from linked Contact
         _enrich_from_contact(resource)
@@ -69,14 +83,10 @@ def get_resources(status=None, department=None, resource_type=None, skill=None,
         )
 
         # Get current assignment count and workload
-        assignments = frappe.get_all(
-            "Orga Assignment",
-            filters={"resource": resource["name"], "status": ["in", ["Assigned", "In Progress"]]},
-            fields=["allocated_hours"]
-        )
-        resource["active_assignments"] = len(assignments)
+        load = workload.get(resource["name"])
+        resource["active_assignments"] = load.count if load else 0
 
-        allocated_hours = sum(a.get("allocated_hours") or 0 for a in assignments)
+        allocated_hours = float(load.allocated_hours or 0) if load else 0
         weekly_capacity = resource.get("weekly_capacity") or 40
         utilization = (allocated_hours / weekly_capacity * 100) if weekly_capacity else 0
 
@@ -456,22 +466,27 @@ def get_resource_stats(name):
     if not name:
         frappe.throw(_("Resource name is required"))
 
-    if not frappe.db.exists("Orga Resource", name):
+    # Only three scalar fields are used; skip loading the doc and its skills table
+    resource = frappe.db.get_value(
+        "Orga Resource", name, ["user", "hourly_cost", "billable_rate"], as_dict=True
+    )
+    if not resource:
         frappe.throw(_("Resource {0} not found").format(name), frappe.DoesNotExistError)
 
-    resource = frappe.get_doc("Orga Resource", name)
-
     # Assignment stats
-    assignment_total = frappe.db.count("Orga Assignment", {"resource": name})
-    assignment_active = frappe.db.count(
-        "Orga Assignment", {"resource": name, "status": ["in", ["Assigned", "In Progress"]]}
-    )
-    assignment_completed = frappe.db.count(
-        "Orga Assignment", {"resource": name, "status": "Completed"}
-    )
-    assignment_cancelled = frappe.db.count(
-        "Orga Assignment", {"resource": name, "status": "Cancelled"}
-    )
+    assignment_result = frappe.db.sql("""
+        SELECT
+            COUNT(*) as total,
+            COALESCE(SUM(CASE WHEN status IN ('Assigned', 'In Progress') THEN 1 ELSE 0 END), 0) as active,
+            COALESCE(SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END), 0) as completed,
+            COALESCE(SUM(CASE WHEN status = 'Cancelled' THEN 1 ELSE 0 END), 0) as cancelled
+        FROM `tabOrga Assignment`
+        WHERE resource = %s
+    """, (name,), as_dict=True)[0]
+    assignment_total = assignment_result.total
+    assignment_active = int(assignment_result.active)
+    assignment_completed = int(assignment_result.completed)
+    assignment_cancelled = int(assignment_result.cancelled)
 
     # Time stats from Watch Entry (soft dependency)
     user_email = resource.user
@@ -18,73 +18,76 @@ import json
 import frappe
 from frappe import _
 from frappe.utils import now_datetime
+from orga.orga.utils.doctypes import doctype_exists, get_doc_or_throw
+from orga.orga.utils.queries import get_values_by_name
+from orga.orga.utils.users import get_user_info
+
+
+def _task_columns() -> frozenset:
+    """Get the Orga Task table columns, read once per request."""
+    columns = getattr(frappe.local, "_orga_task_columns", None)
+    if columns is None:
+        try:
+            columns = frozenset(frappe.db.get_table_columns("Orga Task"))
+        except frappe.db.TableMissingError:
+            columns = frozenset()
+        frappe.local._orga_task_columns = columns
+    return columns
 
 
 def _has_sort_order() -> bool:
     """Check if sort_order column exists on Orga Task (pre-migration safe)."""
-    try:
-        return frappe.db.has_column("Orga Task", "sort_order")
-    except Exception:
-        return False
+    return "sort_order" in _task_columns()
 
 
 def _has_task_group() -> bool:
     """Check if task_group column exists on Orga Task (pre-migration safe)."""
-    try:
-        return frappe.db.has_column("Orga Task", "task_group")
-    except Exception:
-        return False
+    return "task_group" in _task_columns()
 
 
 def _has_depends_on_group() -> bool:
     """Check if depends_on_group column exists on Orga Task (pre-migration safe)."""
-    try:
-        return frappe.db.has_column("Orga Task", "depends_on_group")
-    except Exception:
-        return False
+    return "depends_on_group" in _task_columns()
 
 
 def _has_auto_trail_start() -> bool:
     """Check if auto_trail_start column exists on Orga Task (pre-migration safe)."""
-    try:
-        return frappe.db.has_column("Orga Task", "auto_trail_start")
-    except Exception:
-        return False
+    return "auto_trail_start" in _task_columns()
 
 
 def _has_recurrence() -> bool:
     """Check if is_recurring column exists on Orga Task (pre-migration safe)."""
-    try:
-        return frappe.db.has_column("Orga Task", "is_recurring")
-    except Exception:
-        return False
+    return "is_recurring" in _task_columns()
 
 
 def _has_home_custom_fields() -> bool:
     """Check if Home custom fields exist on Orga Task (added by Home app)."""
-    try:
-        return frappe.db.has_column("Orga Task", "home_property")
-    except Exception:
-        return False
+    return "home_property" in _task_columns()
+
+
+def _get_resource_image(user):
+    """Get the Orga Resource avatar for a user, cached for the current request."""
+    cache = frappe.local.__dict__.setdefault("_orga_resource_image", {})
+    if user not in cache:
+        image = ""
+        try:
+            if frappe.db.has_column("Orga Resource", "image"):
+                image = frappe.db.get_value("Orga Resource", {"user": user}, "image") or ""
+        except Exception:
+            pass
+        cache[user] = image
+    return cache[user]
 
 
 def _enrich_assigned_to(task):
     """Add assigned_to_name and assigned_to_image from User doctype."""
     if task.get("assigned_to"):
-        user_info = frappe.db.get_value(
-            "User", task["assigned_to"], ["full_name", "user_image"], as_dict=True
-        )
+        # Task lists repeat the same few assignees; both lookups are request-cached
+        user_info = get_user_info(task["assigned_to"])
         if user_info:
             task["assigned_to_name"] = user_info.get("full_name") or task["assigned_to"]
             # Prefer the Orga Resource custom avatar over the Frappe User image
-            resource_image = ""
-            try:
-                if frappe.db.has_column("Orga Resource", "image"):
-                    resource_image = frappe.db.get_value(
-                        "Orga Resource", {"user": task["assigned_to"]}, "image"
-                    ) or ""
-            except Exception:
-                pass
+            resource_image = _get_resource_image(task["assigned_to"])
             task["assigned_to_image"] = resource_image or user_info.get("user_image") or ""
         else:
             task["assigned_to_name"] = task["assigned_to"]
@@ -96,7 +99,7 @@ def _enrich_assigned_to(task):
 
 def _enrich_task_resource(task):
     """Add assigned resource info from Orga Assignment if one exists."""
-    if not frappe.db.exists("DocType", "Orga Assignment"):
+    if not doctype_exists("Orga Assignment"):
         task["assigned_resource"] = ""
         task["assigned_resource_name"] = ""
         return
@@ -139,7 +142,7 @@ def _get_resource_assigned_task_names(user):
     Looks up Orga Resources linked to the user, then finds active Orga Assignments
     for those resources, returning the associated task names.
     """
-    if not frappe.db.exists("DocType", "Orga Assignment"):
+    if not doctype_exists("Orga Assignment"):
         return []
 
     # Find resources linked to this user
@@ -275,13 +278,11 @@ def get_task(name):
     if not name:
         frappe.throw(_("Task name is required"))
 
-    if not frappe.db.exists("Orga Task", name):
-        frappe.throw(_("Task {0} not found").format(name), frappe.DoesNotExistError)
+    task = get_doc_or_throw("Orga Task", name, _("Task {0} not found").format(name))
 
-    if not frappe.has_permission("Orga Task", "read", name):
+    if not frappe.has_permission("Orga Task", "read", task):
         frappe.throw(_("Not permitted to access this task"), frappe.PermissionError)
 
-    task = frappe.get_doc("Orga Task", name)
     task_dict = task.as_dict()
 
     # Enrich with related info
@@ -806,10 +807,9 @@ def delete_task(name):
     if not name:
         frappe.throw(_("Task name is required"))
 
-    if not frappe.db.exists("Orga Task", name):
-        frappe.throw(_("Task {0} not found").format(name), frappe.DoesNotExistError)
+    task = get_doc_or_throw("Orga Task", name, _("Task {0} not found").format(name))
 
-    if not frappe.has_permission("Orga Task", "delete", name):
+    if not frappe.has_permission("Orga Task", "delete", task):
         frappe.throw(_("Not permitted to delete this task"), frappe.PermissionError)
 
     # Check for subtasks
@@ -821,14 +821,15 @@ def delete_task(name):
 
     # Remove dependency rows in OTHER tasks that reference this task
     # (i.e., other tasks that depend on the task being deleted)
-    dep_rows = frappe.db.sql("""
-        SELECT name, parent FROM `tabOrga Task Dependency`
+    dep_parents = frappe.db.sql_list("""
+        SELECT DISTINCT parent FROM `tabOrga Task Dependency`
         WHERE depends_on = %s
-    """, (name,), as_dict=True)
-    for dep_row in dep_rows:
-        frappe.db.delete("Orga Task Dependency", {"name": dep_row.name})
-        # Clear cached doc so Frappe doesn't see stale child rows
-        frappe.clear_document_cache("Orga Task", dep_row.parent)
+    """, (name,))
+    if dep_parents:
+        frappe.db.delete("Orga Task Dependency", {"depends_on": name})
+        # Clear cached docs so Frappe doesn't see stale child rows
+        for parent in dep_parents:
+            frappe.clear_document_cache("Orga Task", parent)
 
     # Delete assignments (meaningless without the task)
     for assignment in frappe.get_all("Orga Assignment", filters={"task": name}, pluck="name"):
@@ -837,7 +838,7 @@ def delete_task(name):
     # Clear task reference on appointments, defects (preserve the records)
     # Note: time tracking moved to Watch app (Watch Entry.orga_task custom field stays as historical ref)
     frappe.db.set_value("Orga Appointment", {"task": name}, "task", "", update_modified=False)
-    if frappe.db.exists("DocType", "Orga Defect"):
+    if doctype_exists("Orga Defect"):
         frappe.db.set_value("Orga Defect", {"task": name}, "task", "", update_modified=False)
 
     frappe.delete_doc("Orga Task", name, force=True)
@@ -1143,13 +1144,18 @@ def get_task_checklist(task_name):
     task = frappe.get_doc("Orga Task", task_name)
     checklist = []
 
+    # Resolve completer names in one query instead of one per item
+    user_names = get_values_by_name(
+        "User", [item.completed_by for item in task.checklist], "full_name"
+    )
+
     for item in task.checklist:
         checklist.append({
             "name": item.name,
             "title": item.title,
             "is_completed": item.is_completed,
             "completed_by": item.completed_by,
-            "completed_by_name": frappe.db.get_value("User", item.completed_by, "full_name") if item.completed_by else None,
+            "completed_by_name": user_names.get(item.completed_by) if item.completed_by else None,
             "completed_on": item.completed_on
         })
 
@@ -1222,39 +1228,37 @@ def toggle_checklist_item(task_name, item_name):
     if not frappe.db.exists("Orga Task", task_name):
         frappe.throw(_("Task {0} not found").format(task_name), frappe.DoesNotExistError)
 
-    # Get the checklist item directly
-    if not frappe.db.exists("Orga Task Checklist", item_name):
-        frappe.throw(_("Checklist item {0} not found in task").format(item_name))
-
-    item = frappe.get_doc("Orga Task Checklist", item_name)
-    if item.parent != task_name:
+    # Get the checklist item directly (a missing row yields None)
+    item = frappe.db.get_value(
+        "Orga Task Checklist", item_name, ["parent", "title", "is_completed"], as_dict=True
+    )
+    if not item or item.parent != task_name:
         frappe.throw(_("Checklist item {0} not found in task").format(item_name))
 
     # Toggle completion using db_set to avoid parent save
-    new_completed = not item.is_completed
-    if new_completed:
-        frappe.db.set_value("Orga Task Checklist", item_name, {
+    if not item.is_completed:
+        values = {
             "is_completed": 1,
             "completed_by": frappe.session.user,
             "completed_on": now_datetime()
-        })
+        }
     else:
-        frappe.db.set_value("Orga Task Checklist", item_name, {
+        values = {
             "is_completed": 0,
             "completed_by": None,
             "completed_on": None
-        })
+        }
+    frappe.db.set_value("Orga Task Checklist", item_name, values)
     frappe.db.commit()
 
     # Return updated item
-    item.reload()
     return {
-        "name": item.name,
+        "name": item_name,
         "title": item.title,
-        "is_completed": item.is_completed,
-        "completed_by": item.completed_by,
-        "completed_by_name": frappe.db.get_value("User", item.completed_by, "full_name") if item.completed_by else None,
-        "completed_on": item.completed_on
+        "is_completed": values["is_completed"],
+        "completed_by": values["completed_by"],
+        "completed_by_name": frappe.db.get_value("User", values["completed_by"], "full_name") if values["completed_by"] else None,
+        "completed_on": values["completed_on"]
     }
 
 
@@ -1279,11 +1283,8 @@ def delete_checklist_item(task_name, item_name):
     if not frappe.db.exists("Orga Task", task_name):
         frappe.throw(_("Task {0} not found").format(task_name), frappe.DoesNotExistError)
 
-    if not frappe.db.exists("Orga Task Checklist", item_name):
-        frappe.throw(_("Checklist item {0} not found in task").format(item_name))
-
-    item = frappe.get_doc("Orga Task Checklist", item_name)
-    if item.parent != task_name:
+    item_parent = frappe.db.get_value("Orga Task Checklist", item_name, "parent")
+    if item_parent != task_name:
         frappe.throw(_("Checklist item {0} not found in task").format(item_name))
 
     frappe.delete_doc("Orga Task Checklist", item_name, force=True)
@@ -1732,11 +1733,12 @@ def apply_cascade(task_name, new_start_date=None, new_end_date=None, changes=Non
 
 def _get_project_dependency_mode(project_name):
     """Get the dependency mode for a project. Returns 'Flexible' if not set."""
-    if not project_name or not frappe.db.exists("Orga Project", project_name):
+    if not project_name:
         return "Flexible"
     try:
         if not frappe.db.has_column("Orga Project", "dependency_mode"):
             return "Flexible"
+        # get_value returns None for a missing project, no separate exists() needed
         mode = frappe.db.get_value("Orga Project", project_name, "dependency_mode")
         return mode or "Flexible"
     except Exception as e:
@@ -1746,7 +1748,7 @@ def _get_project_dependency_mode(project_name):
 
 def _get_project_auto_schedule_on_completion(project_name):
     """Check if auto-schedule on completion is enabled for a project."""
-    if not project_name or not frappe.db.exists("Orga Project", project_name):
+    if not project_name:
         return False
     try:
         if not frappe.db.has_column("Orga Project", "auto_schedule_on_completion"):
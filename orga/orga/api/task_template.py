@@ -46,11 +46,20 @@ def get_templates(category=None):
         order_by="template_name asc",
     )
 
-    # Enrich with task count
+    # Enrich with task count (one grouped query for all templates)
+    task_counts = {}
+    if templates:
+        task_counts = dict(frappe.db.sql(
+            """
+            SELECT parent, COUNT(*)
+            FROM `tabOrga Task Template Item`
+            WHERE parenttype = 'Orga Task Template' AND parent IN %s
+            GROUP BY parent
+            """,
+            (tuple(t["name"] for t in templates),),
+        ))
     for tpl in templates:
-        tpl["task_count"] = frappe.db.count(
-            "Orga Task Template Item", {"parent": tpl["name"]}
-        )
+        tpl["task_count"] = task_counts.get(tpl["name"], 0)
 
     system = [t for t in templates if t.get("is_system_template")]
     custom = [t for t in templates if not t.get("is_system_template")]
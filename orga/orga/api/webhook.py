@@ -115,12 +115,20 @@ def get_webhooks(limit: int = 50, offset: int = 0):
         order_by="webhook_name asc"
     )
 
-    # Get event counts for each webhook
+    # Get event counts for all listed webhooks in one query
+    event_counts = {}
+    if webhooks:
+        event_counts = dict(frappe.db.sql(
+            """
+            SELECT parent, COUNT(*)
+            FROM `tabOrga Webhook Event`
+            WHERE parenttype = 'Orga Webhook' AND parent IN %s
+            GROUP BY parent
+            """,
+            (tuple(w.name for w in webhooks),),
+        ))
     for webhook in webhooks:
-        webhook["event_count"] = frappe.db.count(
-            "Orga Webhook Event",
-            {"parent": webhook.name}
-        )
+        webhook["event_count"] = event_counts.get(webhook.name, 0)
 
     total = frappe.db.count("Orga Webhook")
 
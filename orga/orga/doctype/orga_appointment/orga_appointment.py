@@ -8,6 +8,57 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 from frappe.utils import get_datetime, time_diff_in_seconds, add_to_date
+from orga.orga.utils.users import get_user_info
+
+# Default calendar colors per event type
+EVENT_TYPE_COLORS = {
+    "Meeting": "#8B5CF6",    # Purple
+    "Deadline": "#EF4444",   # Red
+    "Review": "#3B82F6",     # Blue
+    "Milestone": "#F59E0B",  # Amber
+    "Other": "#6B7280"       # Gray
+}
+
+
+def get_default_event_color(event_type):
+    """Return default calendar color for an event type"""
+    return EVENT_TYPE_COLORS.get(event_type, "#6B7280")
+
+
+def build_calendar_event(appointment, project_name, attendee_count, accepted_count):
+    """
+    Build the calendar payload for an appointment.
+
+    Shared by the document method and the batched calendar API, which
+    prefetch the project name and RSVP counts for many rows at once.
+
+    Args:
+        appointment: Orga Appointment document or row
+        project_name: Name of the linked project, if any
+        attendee_count: Number of attendees
+        accepted_count: Number of attendees who accepted
+
+    Returns:
+        dict: Calendar event data
+    """
+    return {
+        "id": appointment.name,
+        "title": appointment.title,
+        "start": str(appointment.start_datetime),
+        "end": str(appointment.end_datetime) if appointment.end_datetime else None,
+        "allDay": bool(appointment.all_day),
+        "color": appointment.color or get_default_event_color(appointment.event_type),
+        "extendedProps": {
+            "event_type": appointment.event_type,
+            "status": appointment.status,
+            "project": appointment.project,
+            "project_name": project_name if appointment.project else None,
+            "location": appointment.location,
+            "meeting_url": appointment.meeting_url,
+            "attendee_count": attendee_count,
+            "accepted_count": accepted_count
+        }
+    }
 
 
 class OrgaAppointment(Document):
@@ -61,35 +112,14 @@ class OrgaAppointment(Document):
 
     def get_calendar_event_data(self):
         """Return data formatted for calendar display"""
-        return {
-            "id": self.name,
-            "title": self.title,
-            "start": str(self.start_datetime),
-            "end": str(self.end_datetime) if self.end_datetime else None,
-            "allDay": bool(self.all_day),
-            "color": self.color or self.get_default_color(),
-            "extendedProps": {
-                "event_type": self.event_type,
-                "status": self.status,
-                "project": self.project,
-                "project_name": frappe.db.get_value("Orga Project", self.project, "project_name") if self.project else None,
-                "location": self.location,
-                "meeting_url": self.meeting_url,
-                "attendee_count": self.get_attendee_count(),
-                "accepted_count": self.get_accepted_count()
-            }
-        }
+        project_name = frappe.db.get_value("Orga Project", self.project, "project_name") if self.project else None
+        return build_calendar_event(
+            self, project_name, self.get_attendee_count(), self.get_accepted_count()
+        )
 
     def get_default_color(self):
         """Return default color based on event type"""
-        colors = {
-            "Meeting": "#8B5CF6",    # Purple
-            "Deadline": "#EF4444",   # Red
-            "Review": "#3B82F6",     # Blue
-            "Milestone": "#F59E0B",  # Amber
-            "Other": "#6B7280"       # Gray
-        }
-        return colors.get(self.event_type, "#6B7280")
+        return get_default_event_color(self.event_type)
 
     def after_insert(self):
         """Log activity on creation"""
@@ -114,7 +144,7 @@ class OrgaAppointment(Document):
                 "reference_doctype": "Orga Appointment",
                 "reference_name": self.name,
                 "user": frappe.session.user,
-                "full_name": frappe.db.get_value("User", frappe.session.user, "full_name")
+                "full_name": get_user_info(frappe.session.user).get("full_name")
             }).insert(ignore_permissions=True)
         except Exception as e:
             # Don't fail the main operation if logging fails
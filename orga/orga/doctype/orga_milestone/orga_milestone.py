@@ -8,6 +8,7 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 from frappe.utils import getdate, nowdate
+from orga.orga.utils.doctypes import doctype_exists
 
 
 class OrgaMilestone(Document):
@@ -48,7 +49,7 @@ class OrgaMilestone(Document):
 
     def get_linked_tasks(self):
         """Get all tasks linked to this milestone"""
-        if not frappe.db.exists("DocType", "Orga Task"):
+        if not doctype_exists("Orga Task"):
             return []
 
         return frappe.get_all(
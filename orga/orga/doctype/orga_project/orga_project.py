@@ -8,6 +8,7 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 from frappe.utils import getdate, nowdate
+from orga.orga.utils.doctypes import doctype_exists
 
 
 class OrgaProject(Document):
@@ -48,7 +49,7 @@ class OrgaProject(Document):
 
     def update_estimated_cost(self):
         """Calculate estimated_cost as sum of estimated_cost from all project tasks"""
-        if not frappe.db.exists("DocType", "Orga Task"):
+        if not doctype_exists("Orga Task"):
             return
 
         result = frappe.db.sql("""
@@ -64,7 +65,7 @@ class OrgaProject(Document):
 
     def update_spent(self):
         """Calculate spent as sum of actual_cost from all project tasks"""
-        if not frappe.db.exists("DocType", "Orga Task"):
+        if not doctype_exists("Orga Task"):
             return
 
         result = frappe.db.sql("""
@@ -80,29 +81,29 @@ class OrgaProject(Document):
 
     def update_progress(self):
         """Calculate progress as average of all task progress values"""
-        if not frappe.db.exists("DocType", "Orga Task"):
+        if not doctype_exists("Orga Task"):
             return
 
-        tasks = frappe.get_all(
+        task_progress = frappe.get_all(
             "Orga Task",
             filters={"project": self.name},
-            fields=["progress"]
+            pluck="progress"
         )
 
-        if not tasks:
+        if not task_progress:
             if self.progress != 0:
                 self.db_set("progress", 0, update_modified=False)
             return
 
-        total_progress = sum(t.progress or 0 for t in tasks)
-        progress = round(total_progress / len(tasks), 2)
+        total_progress = sum(p or 0 for p in task_progress)
+        progress = round(total_progress / len(task_progress), 2)
 
         if self.progress != progress:
             self.db_set("progress", progress, update_modified=False)
 
     def on_trash(self):
         """Prevent deletion if project has tasks"""
-        if frappe.db.exists("DocType", "Orga Task"):
+        if doctype_exists("Orga Task"):
             task_count = frappe.db.count("Orga Task", filters={"project": self.name})
             if task_count > 0:
                 frappe.throw(
@@ -115,10 +115,10 @@ class OrgaResource(Document):
                 "start_date": ["<=", end_date],
                 "end_date": [">=", start_date]
             },
-            fields=["allocated_hours"]
+            pluck="allocated_hours"
         )
 
-        allocated = sum(a.allocated_hours or 0 for a in assignments)
+        allocated = sum(hours or 0 for hours in assignments)
         utilization = (allocated / self.weekly_capacity * 100) if self.weekly_capacity else 0
 
         return {
@@ -104,11 +104,11 @@ class OrgaTask(Document):
         deps = frappe.get_all(
             "Orga Task Dependency",
             filters={"parent": task_name},
-            fields=["depends_on"]
+            pluck="depends_on"
         )
 
-        for dep in deps:
-            if self._creates_dependency_cycle(dep.depends_on, visited):
+        for depends_on in deps:
+            if self._creates_dependency_cycle(depends_on, visited):
                 return True
 
         return False
@@ -144,13 +144,14 @@ class OrgaTask(Document):
             except Exception as e:
                 frappe.log_error(f"Column check failed: {e}", "Orga Task Blocked Status")
             if has_col:
-                incomplete = frappe.db.count("Orga Task", {
+                # exists() stops at the first match (LIMIT 1); the count was never used
+                incomplete = frappe.db.exists("Orga Task", {
                     "project": self.project,
                     "task_group": depends_on_group,
                     "status": ["not in", ["Completed", "Cancelled"]],
                     "name": ["!=", self.name]
                 })
-                if incomplete > 0:
+                if incomplete:
                     self.is_blocked = 1
                     return
 
@@ -299,11 +300,9 @@ class OrgaTask(Document):
         dependents = frappe.get_all(
             "Orga Task Dependency",
             filters={"depends_on": self.name},
-            fields=["parent"]
+            pluck="parent"
         )
-        for dep in dependents:
-            if dep.parent != self.name:
-                updated.add(dep.parent)
+        updated.update(parent for parent in dependents if parent != self.name)
 
         # 2. Tasks that depend on this task's group (same project)
         task_group = getattr(self, "task_group", None)
@@ -314,17 +313,15 @@ class OrgaTask(Document):
             except Exception as e:
                 frappe.log_error(f"Column check failed: {e}", "Orga Task Dependents")
             if has_col:
-                group_dependents = frappe.get_all(
+                updated.update(frappe.get_all(
                     "Orga Task",
                     filters={
                         "project": self.project,
                         "depends_on_group": task_group,
                         "name": ["!=", self.name]
                     },
-                    fields=["name"]
-                )
-                for t in group_dependents:
-                    updated.add(t.name)
+                    pluck="name"
+                ))
 
         # Recalculate blocked status for all affected tasks
         for task_name in updated:
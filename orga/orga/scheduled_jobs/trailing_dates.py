@@ -2,7 +2,7 @@
 # Copyright (C) 2024-2026 Tonic
 
 import frappe
-from frappe.utils import nowdate, getdate, add_days
+from frappe.utils import now, nowdate
 
 
 def update_trailing_start_dates():
@@ -29,20 +29,29 @@ def update_trailing_start_dates():
             "progress": 0,
             "start_date": ["<", today],
         },
-        fields=["name", "start_date", "due_date"],
+        pluck="name",
     )
+    if not tasks:
+        return
+
+    # One UPDATE for all qualifying tasks. Keep due_date ahead of start_date
+    # in the SET list: MariaDB/MySQL apply assignments left to right, so
+    # DATEDIFF must run before start_date is overwritten. (With MariaDB's
+    # SIMULTANEOUS_ASSIGNMENT mode every expression reads the original row,
+    # which gives the same result.)
+    frappe.db.sql(
+        """
+        UPDATE `tabOrga Task`
+        SET due_date = DATE_ADD(due_date, INTERVAL DATEDIFF(%(today)s, start_date) DAY),
+            start_date = %(today)s,
+            modified = %(now)s,
+            modified_by = %(user)s
+        WHERE name IN %(tasks)s
+        """,
+        {"today": today, "now": now(), "user": frappe.session.user, "tasks": tuple(tasks)},
+    )
+    frappe.db.commit()
 
+    # The rows were written outside the document, so drop any cached copies
     for task in tasks:
-        old_start = getdate(task.start_date)
-        shift = (getdate(today) - old_start).days
-        frappe.db.set_value(
-            "Orga Task", task.name, "start_date", today, update_modified=True
-        )
-        if task.due_date:
-            new_due = add_days(task.due_date, shift)
-            frappe.db.set_value(
-                "Orga Task", task.name, "due_date", str(new_due), update_modified=True
-            )
-
-    if tasks:
-        frappe.db.commit()
+        frappe.clear_document_cache("Orga Task", task)
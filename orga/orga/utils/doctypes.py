@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 Tonic
+
+"""
+DocType and document loading helpers.
+
+Optional doctypes (Orga Assignment, Orga Defect, ...) are probed before use,
+often once per row of a list. The installed set cannot change mid-request,
+so each probe hits the database once per request. Results are not kept
+across requests because they differ per site and change on migrate.
+"""
+
+import frappe
+
+
+def doctype_exists(doctype: str) -> bool:
+    """
+    Check whether a DocType is installed, cached for the current request.
+
+    Args:
+        doctype: DocType name
+
+    Returns:
+        bool: True if the DocType exists on this site
+    """
+    cache = frappe.local.__dict__.setdefault("_orga_doctype_exists", {})
+    if doctype not in cache:
+        cache[doctype] = bool(frappe.db.exists("DocType", doctype))
+    return cache[doctype]
+
+
+def get_doc_or_throw(doctype: str, name: str, message: str, exc=frappe.DoesNotExistError):
+    """
+    Load a document, replacing get_doc's generic not-found error with our own.
+
+    Saves the separate exists() query that usually precedes get_doc.
+
+    Args:
+        doctype: DocType name
+        name: Document name
+        message: Translated message to throw if the document does not exist
+        exc: Exception class to throw (default: DoesNotExistError)
+
+    Returns:
+        Document: The loaded document
+    """
+    try:
+        return frappe.get_doc(doctype, name)
+    except frappe.DoesNotExistError:
+        frappe.clear_last_message()
+        frappe.throw(message, exc)
@@ -40,71 +40,134 @@ def parse_mentions(text: str) -> list:
     Returns:
         list: List of unique user emails/IDs mentioned
     """
-    if not text:
+    # Most comments mention nobody; skip both regex passes for them
+    if not text or "@" not in text:
         return []
 
-    mentions = []
-
-    # Rich mentions: @[Name](email)
-    for match in RICH_MENTION_PATTERN.finditer(text):
-        email = match.group(2)
-        if frappe.db.exists("User", email):
-            mentions.append(email)
-
-    # Simple mentions: @email or @username
+    # Collect candidates first so each lookup kind is a single query;
+    # the match offset keeps the result in the order the mentions appear
+    emails = [(m.start(), m.group(2)) for m in RICH_MENTION_PATTERN.finditer(text)]
+    usernames = []
     for match in SIMPLE_MENTION_PATTERN.finditer(text):
         identifier = match.group(1)
 
         # Check if it looks like an email
         if '@' in identifier and '.' in identifier.split('@')[-1]:
-            if frappe.db.exists("User", identifier):
-                mentions.append(identifier)
+            emails.append((match.start(), identifier))
         else:
-            # Try to find user by username or match email
-            user = frappe.db.get_value(
+            usernames.append((match.start(), identifier))
+
+    resolved = []
+
+    if emails:
+        # The IN match runs in MariaDB and ignores case; map back to the
+        # canonical User name the same way
+        by_email = {
+            name.lower(): name
+            for name in frappe.get_all(
                 "User",
-                {"username": identifier, "enabled": 1},
-                "name"
+                filters={"name": ["in", list({e for pos, e in emails})]},
+                pluck="name"
             )
-            if user:
-                mentions.append(user)
-            else:
-                # Try partial email match
-                user = frappe.db.get_value(
-                    "User",
-                    {"name": ["like", f"{identifier}@%"], "enabled": 1},
-                    "name"
-                )
+        }
+        resolved.extend(
+            (pos, by_email[email.lower()]) for pos, email in emails if email.lower() in by_email
+        )
+
+    if usernames:
+        # Try to find user by username
+        by_username = {
+            username.lower(): name
+            for username, name in frappe.get_all(
+                "User",
+                filters={"username": ["in", list({u for pos, u in usernames})], "enabled": 1},
+                fields=["username", "name"],
+                as_list=True
+            )
+        }
+
+        # Try partial email match for the rest
+        unresolved = {u for pos, u in usernames if u.lower() not in by_username}
+        by_prefix = {}
+        if unresolved:
+            candidates = frappe.get_all(
+                "User",
+                filters={"enabled": 1},
+                or_filters=[["name", "like", f"{u}@%"] for u in unresolved],
+                pluck="name",
+                order_by="creation desc"
+            )
+            for identifier in unresolved:
+                prefix = f"{identifier}@".lower()
+                user = next((c for c in candidates if c.lower().startswith(prefix)), None)
                 if user:
-                    mentions.append(user)
+                    by_prefix[identifier] = user
 
-    # Return unique mentions
-    return list(set(mentions))
+        for pos, identifier in usernames:
+            user = by_username.get(identifier.lower()) or by_prefix.get(identifier)
+            if user:
+                resolved.append((pos, user))
+
+    # Return unique mentions in the order they first appear in the text
+    resolved.sort(key=lambda item: item[0])
+    return list(dict.fromkeys(user for pos, user in resolved))
 
 
 def process_comment_mentions(doc, comment_text: str):
     """
     Process mentions in a comment and publish notifications to Dock.
 
+    Publishing happens in a background job queued after commit, so the
+    request that saved the comment does not wait on one Dock insert and
+    realtime push per mentioned user.
+
     Args:
         doc: Parent document (Task, Project, etc.)
         comment_text: Comment text to parse
     """
-    from orga.orga.integrations.dock_notification import publish
-
     mentions = parse_mentions(comment_text)
 
-    for user in mentions:
-        if user != frappe.session.user:
-            truncated = (comment_text[:200] + "...") if len(comment_text) > 200 else comment_text
-            publish(
-                notification_type="comment_mention",
-                title=_("You were mentioned in {0}").format(doc.name),
-                for_user=user,
-                message=truncated,
-                reference_doctype=doc.doctype,
-                reference_name=doc.name,
-            )
+    # Session user is gone in the worker; drop self-mentions here
+    current_user = frappe.session.user
+    recipients = [user for user in mentions if user != current_user]
+    if not recipients:
+        return
+
+    truncated = (comment_text[:200] + "...") if len(comment_text) > 200 else comment_text
+
+    frappe.enqueue(
+        "orga.orga.utils.mentions.send_mention_notifications",
+        queue="short",
+        enqueue_after_commit=True,
+        reference_doctype=doc.doctype,
+        reference_name=doc.name,
+        users=recipients,
+        message=truncated,
+    )
+
+
+def send_mention_notifications(reference_doctype: str, reference_name: str, users: list, message: str):
+    """
+    Publish comment-mention notifications to Dock (background job).
+
+    Args:
+        reference_doctype: DocType of the commented document
+        reference_name: Name of the commented document
+        users: Mentioned users to notify
+        message: Truncated comment text
+    """
+    from orga.orga.integrations.dock_notification import publish
+
+    title = _("You were mentioned in {0}").format(reference_name)
+    for user in users:
+        publish(
+            notification_type="comment_mention",
+            title=title,
+            for_user=user,
+            message=message,
+            reference_doctype=reference_doctype,
+            reference_name=reference_name,
+        )
 
 
 def get_user_mentions_autocomplete(search: str, limit: int = 10) -> list:
@@ -118,18 +181,39 @@ def get_user_mentions_autocomplete(search: str, limit: int = 10) -> list:
     Returns:
         list: Users matching search [{name, full_name, email}]
     """
-    filters = {"enabled": 1}
+    filters = {"enabled": 1, "name": ["not in", ("Administrator", "Guest")]}
+    fields = ["name", "full_name", "user_image"]
 
     if search:
-        filters["full_name"] = ["like", f"%{search}%"]
-
-    users = frappe.get_all(
-        "User",
-        filters=filters,
-        fields=["name", "full_name", "user_image"],
-        order_by="full_name",
-        limit_page_length=limit
-    )
+        # Prefix match first: it can use an index on full_name, "%x%" cannot
+        users = frappe.get_all(
+            "User",
+            filters={**filters, "full_name": ["like", f"{search}%"]},
+            fields=fields,
+            order_by="full_name",
+            limit_page_length=limit
+        )
+        # Fall back to substring matches only when prefixes don't fill the list
+        if len(users) < limit:
+            users += frappe.get_all(
+                "User",
+                filters={
+                    **filters,
+                    "full_name": ["like", f"%{search}%"],
+                    "name": ["not in", ("Administrator", "Guest", *(u.name for u in users))],
+                },
+                fields=fields,
+                order_by="full_name",
+                limit_page_length=limit - len(users)
+            )
+    else:
+        users = frappe.get_all(
+            "User",
+            filters=filters,
+            fields=fields,
+            order_by="full_name",
+            limit_page_length=limit
+        )
 
     # Format for autocomplete
     return [
@@ -140,5 +224,4 @@ def get_user_mentions_autocomplete(search: str, limit: int = 10) -> list:
             "image": u.user_image
         }
         for u in users
-        if u.name not in ("Administrator", "Guest")
     ]
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 Tonic
+
+"""
+Decoding of JSON arguments passed to whitelisted endpoints.
+
+frappe.call sends list and dict arguments as JSON strings. orjson decodes
+them faster than the stdlib and is used when installed.
+"""
+
+import json
+import frappe
+from frappe import _
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+def parse_json_arg(value):
+    """
+    Decode a JSON string argument; values that are already decoded pass through.
+
+    Args:
+        value: JSON string, or an already decoded dict/list
+
+    Returns:
+        The decoded value
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        return _loads(value)
+    except ValueError:
+        frappe.throw(_("Invalid JSON payload"))
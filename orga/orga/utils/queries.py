@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 Tonic
+
+"""
+Query helpers shared by the list endpoints.
+
+List endpoints return one page of rows plus the unpaginated total. Running
+get_all and then db.count scans the same filtered set twice; COUNT(*) OVER()
+(MariaDB 10.2+) returns the total alongside the page in a single query.
+
+Rows on a page are then enriched with fields of linked records (project
+names, resource names, ...), fetched for the whole page in one query.
+"""
+
+import frappe
+
+
+def get_page_with_total(doctype: str, filters: dict, fields: list, order_by: str,
+                        limit: int, offset: int) -> tuple[list, int]:
+    """
+    Fetch one page of rows and the total number of matching rows.
+
+    Like frappe.get_all, this does not apply user permissions.
+
+    Args:
+        doctype: DocType name
+        filters: {fieldname: value} equality filters
+        fields: Fieldnames to select
+        order_by: ORDER BY clause
+        limit: Page size
+        offset: Rows to skip
+
+    Returns:
+        tuple: (rows as dicts, total count)
+    """
+    limit, offset = int(limit), int(offset)
+    where_clause = ""
+    if filters:
+        where_clause = "WHERE " + " AND ".join(f"`{field}` = %({field})s" for field in filters)
+    columns = ", ".join(f"`{field}`" for field in fields)
+
+    rows = frappe.db.sql(f"""
+        SELECT {columns}, COUNT(*) OVER() as total_count
+        FROM `tab{doctype}`
+        {where_clause}
+        ORDER BY {order_by}
+        LIMIT %(page_limit)s OFFSET %(page_offset)s
+    """, {**filters, "page_limit": limit, "page_offset": offset}, as_dict=True)
+
+    if rows:
+        total = rows[0].total_count
+        for row in rows:
+            row.pop("total_count")
+    elif not offset:
+        total = 0
+    else:
+        # Empty page past the end: no row to carry the total
+        total = frappe.db.count(doctype, filters)
+
+    return rows, total
+
+
+def get_values_by_name(doctype: str, names, fields) -> dict:
+    """
+    Fetch fields of several documents with a single query.
+
+    Like frappe.db.get_value, this does not apply user permissions.
+
+    Args:
+        doctype: DocType name
+        names: Document names; empty and duplicate names are skipped
+        fields: A fieldname, or a list of fieldnames
+
+    Returns:
+        dict: {name: value} for a single fieldname, {name: row} for a list
+    """
+    unique_names = list({n for n in names if n})
+    if not unique_names:
+        return {}
+
+    filters = {"name": ["in", unique_names]}
+    if isinstance(fields, str):
+        return dict(frappe.db.get_values(doctype, filters, ["name", fields]))
+
+    rows = frappe.db.get_values(doctype, filters, ["name", *fields], as_dict=True)
+    return {row.name: row for row in rows}
+
+
+def get_task_counts_by_project(project_names: list[str]) -> dict:
+    """
+    Get task counts for several projects with a single GROUP BY query.
+
+    Returns:
+        dict: {project: {total, open, completed, overdue}}; projects without
+        tasks are absent
+    """
+    if not project_names:
+        return {}
+
+    rows = frappe.db.sql("""
+        SELECT
+            project,
+            COUNT(*) as total,
+            SUM(CASE WHEN status = 'Open' THEN 1 ELSE 0 END) as open,
+            SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END) as completed,
+            SUM(CASE WHEN status NOT IN ('Completed', 'Cancelled')
+                AND due_date < %s THEN 1 ELSE 0 END) as overdue
+        FROM `tabOrga Task`
+        WHERE project IN %s
+        GROUP BY project
+    """, (frappe.utils.nowdate(), tuple(project_names)), as_dict=True)
+
+    return {
+        row.project: {
+            "total": row.total,
+            "open": int(row.open or 0),
+            "completed": int(row.completed or 0),
+            "overdue": int(row.overdue or 0),
+        }
+        for row in rows
+    }
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 Tonic
+
+"""
+Request-scoped User lookups.
+
+The same user (usually the session user) is often resolved several times
+while handling one request, e.g. by a doc hook and by the notification that
+follows it. Results are kept on frappe.local so they die with the request.
+"""
+
+from functools import lru_cache
+import frappe
+
+
+def get_user_info(user: str) -> dict:
+    """
+    Get full_name and user_image for a user, cached for the current request.
+
+    Args:
+        user: User ID (email)
+
+    Returns:
+        dict: {full_name, user_image}, empty if the user does not exist
+    """
+    if not user:
+        return {}
+
+    cache = frappe.local.__dict__.setdefault("_orga_user_info", {})
+    if user not in cache:
+        cache[user] = frappe.db.get_value(
+            "User", user, ["full_name", "user_image"], as_dict=True
+        ) or {}
+    return cache[user]
+
+
+def get_user_fullname(user: str) -> str:
+    """Get a user's full name for display, falling back to the user ID."""
+    return get_user_info(user).get("full_name") or user
+
+
+@lru_cache(maxsize=4096)
+def get_initials(name):
+    """Helper to get initials from a name"""
+    if not name:
+        return "?"
+    parts = name.split()
+    if len(parts) >= 2:
+        return (parts[0][0] + parts[-1][0]).upper()
+    return name[:2].upper()
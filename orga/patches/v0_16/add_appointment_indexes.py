@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 Tonic
+
+"""
+Add composite indexes for the appointment list and calendar queries.
+
+get_appointments, get_calendar_events and get_my_appointments filter Orga
+Appointment by project or status and sort on start_datetime; attendee lookups
+go by resource (to find a user's appointments) or by parent + resource (to
+find one attendee row). Child tables only get a single-column parent index
+by default.
+
+Idempotent — add_index skips indexes that already exist.
+"""
+
+import frappe
+
+
+APPOINTMENT_INDEXES = [
+    ["start_datetime"],
+    ["project", "start_datetime"],
+    ["status", "start_datetime"],
+]
+
+ATTENDEE_INDEXES = [
+    ["resource", "parent"],
+    ["parent", "resource"],
+]
+
+
+def execute():
+    for doctype, indexes in (
+        ("Orga Appointment", APPOINTMENT_INDEXES),
+        ("Orga Appointment Attendee", ATTENDEE_INDEXES),
+    ):
+        if not frappe.db.table_exists(doctype):
+            continue
+        for fields in indexes:
+            frappe.db.add_index(doctype, fields)
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 Tonic
+
+"""
+Add composite indexes for the assignment and automation rule list queries.
+
+get_assignments / get_resource_assignments filter Orga Assignment by
+resource, task or project together with status; get_rules filters Orga
+Automation Rule by applies_to and is_active and sorts on modified. The rule
+child tables already carry the standard parent index.
+
+Idempotent — add_index skips indexes that already exist.
+"""
+
+import frappe
+
+
+INDEXES = {
+    "Orga Assignment": [
+        ["resource", "status", "start_date"],
+        ["task", "status"],
+        ["project", "status"],
+    ],
+    "Orga Automation Rule": [
+        ["applies_to", "is_active", "modified"],
+    ],
+}
+
+
+def execute():
+    for doctype, indexes in INDEXES.items():
+        if not frappe.db.table_exists(doctype):
+            continue
+        for fields in indexes:
+            frappe.db.add_index(doctype, fields)
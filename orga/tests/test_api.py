@@ -66,6 +66,20 @@ class TestProjectAPI(FrappeTestCase):
         self.assertIn("milestones", result)
         self.assertIn("total", result["tasks"])
 
+    def test_get_project_missing_raises(self):
+        """Test get_project reports a missing project"""
+        from orga.orga.api.project import get_project
+
+        with self.assertRaises(frappe.DoesNotExistError):
+            get_project("ORG-MISSING-PROJECT")
+
+    def test_delete_project_missing_raises(self):
+        """Test delete_project reports a missing project even for Administrator"""
+        from orga.orga.api.project import delete_project
+
+        with self.assertRaises(frappe.DoesNotExistError):
+            delete_project("ORG-MISSING-PROJECT")
+
 
 class TestTaskAPI(FrappeTestCase):
     def test_get_tasks(self):
@@ -225,6 +239,69 @@ class TestTaskAPI(FrappeTestCase):
         task_names = [t["name"] for t in result["tasks"]]
         self.assertIn(task.name, task_names)
 
+    def test_get_task_missing_raises(self):
+        """Test get_task reports a missing task"""
+        from orga.orga.api.task import get_task
+
+        with self.assertRaises(frappe.DoesNotExistError):
+            get_task("TASK-MISSING")
+
+    def test_delete_task_missing_raises(self):
+        """Test delete_task reports a missing task even for Administrator"""
+        from orga.orga.api.task import delete_task
+
+        with self.assertRaises(frappe.DoesNotExistError):
+            delete_task("TASK-MISSING")
+
+
+class TestMilestoneAPI(FrappeTestCase):
+    def test_get_milestones_total_is_milestone_count(self):
+        """Test get_milestones total counts milestones, not tasks"""
+        from orga.orga.api.milestone import get_milestones
+
+        project = create_test_project()
+        milestone = frappe.get_doc({
+            "doctype": "Orga Milestone",
+            "milestone_name": "API Test Milestone",
+            "project": project.name,
+            "status": "Upcoming",
+            "due_date": add_days(nowdate(), 14)
+        })
+        milestone.insert()
+        for i in range(3):
+            frappe.get_doc({
+                "doctype": "Orga Task",
+                "subject": f"Milestone Task {i}",
+                "project": project.name,
+                "milestone": milestone.name,
+                "status": "Open",
+                "priority": "Medium"
+            }).insert()
+
+        result = get_milestones(project.name)
+
+        self.assertEqual(result["total"], 1)
+        self.assertEqual(result["milestones"][0]["task_count"], 3)
+        self.assertEqual(result["milestones"][0]["completion_percentage"], 0)
+
+
+class TestAppointmentAPI(FrappeTestCase):
+    def test_update_rsvp_non_attendee_raises(self):
+        """Test update_rsvp rejects a user who is not an attendee"""
+        from orga.orga.api.appointment import update_rsvp
+
+        appointment = frappe.get_doc({
+            "doctype": "Orga Appointment",
+            "title": "API Test Appointment",
+            "event_type": "Meeting",
+            "status": "Scheduled",
+            "start_datetime": f"{add_days(nowdate(), 1)} 10:00:00"
+        })
+        appointment.insert()
+
+        with self.assertRaises(frappe.ValidationError):
+            update_rsvp(appointment.name, "Accepted")
+
 
 class TestDashboardAPI(FrappeTestCase):
     def test_get_stats(self):